@@ -22,8 +22,6 @@ import atexit
 import logging
 from typing import Optional
 
-from .utils import lt, LIBTORRENT_AVAILABLE as _LIBTORRENT_AVAILABLE
-
 # Setup logging — use NullHandler per Python library best practices.
 # This avoids "No handlers found" warnings while leaving log
 # configuration (level, format, handlers) entirely to the end-user.
@@ -55,6 +53,20 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    """PEP 562 lazy attributes.
+
+    Importing ``llmpt.utils`` pulls in the native libtorrent extension, which
+    is slow to load and irrelevant for users who only import lightweight
+    helpers.  Resolving the availability flag on first access keeps a plain
+    ``import llmpt`` cheap.
+    """
+    if name == '_LIBTORRENT_AVAILABLE':
+        from .utils import LIBTORRENT_AVAILABLE
+        return LIBTORRENT_AVAILABLE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _disable_xet_storage(config: dict) -> None:
     """Disable HuggingFace's Xet Storage engine so ALL files go through http_get.
 
@@ -141,7 +153,9 @@ def enable_p2p(
     """
     global _patched, _config, _atexit_registered, _webseed_proxy
 
-    if not _LIBTORRENT_AVAILABLE:
+    from .utils import LIBTORRENT_AVAILABLE
+
+    if not LIBTORRENT_AVAILABLE:
         logger.warning(
             "⚠️  libtorrent not available. P2P downloads disabled.\n"
             "   Install with: pip install libtorrent"
@@ -280,6 +294,12 @@ def disable_p2p() -> None:
     from .patch import remove_patch
     remove_patch()
 
+    from .tracker_client import clear_torrent_info_cache
+    clear_torrent_info_cache()
+
+    from .patch import _close_tracker_clients
+    _close_tracker_clients()
+
     _restore_xet_storage(_config)
 
     # Stop WebSeed proxy
@@ -104,4 +104,14 @@ def snapshot_alert(alert: object, lt_module: object) -> AlertEvent | None:
             message=_alert_message(alert),
         )
 
+    if _matches_alert_type(alert, lt_module, "file_completed_alert"):
+        # The event itself only logs, but routing it wakes the session's
+        # monitor thread, so delivery of a finished file starts immediately
+        # instead of on the next polling tick.
+        return AlertLogEvent(
+            log_level=logging.DEBUG,
+            prefix="FILE COMPLETED",
+            message=_alert_message(alert),
+        )
+
     return None
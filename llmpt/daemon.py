@@ -21,6 +21,7 @@ import random
 import re
 import signal
 import sys
+import threading
 import time
 from typing import Dict, Optional, Set, Tuple
 
@@ -687,12 +688,19 @@ def _daemon_main(
     # key -> {"attempts": int, "next_retry_ts": float, "last_error": str}
     failed_attempts: Dict[SeedSessionKey, Dict[str, object]] = {}
 
-    running = True
+    # Event-based shutdown flag: the main loop blocks on it instead of
+    # polling a boolean once per second, so an idle daemon wakes only once
+    # per scan interval and SIGTERM takes effect immediately.
+    stop_event = threading.Event()
+    # Wakeup event for the main loop: set by the signal handler and by the
+    # IPC "scan" action, so an explicit rescan request interrupts the long
+    # wait instead of sitting until the next scheduled scan tick.
+    wakeup_event = threading.Event()
 
     def _signal_handler(signum, frame):
-        nonlocal running
         logger.info(f"Received signal {signum}, shutting down...")
-        running = False
+        stop_event.set()
+        wakeup_event.set()
 
     signal.signal(signal.SIGTERM, _signal_handler)
     signal.signal(signal.SIGINT, _signal_handler)
@@ -919,6 +927,8 @@ def _daemon_main(
             except Exception as e:
                 logger.warning(f"Failed to clear cache import state before scan: {e}")
             last_scan_time = 0.0
+            # Interrupt the main loop's long wait so the scan runs now.
+            wakeup_event.set()
             return {"status": "ok", "message": "scan triggered"}
 
         elif action == "unseed":
@@ -967,7 +977,7 @@ def _daemon_main(
 
     logger.info("Daemon started, entering main loop")
 
-    while running:
+    while not stop_event.is_set():
         try:
             # Periodic HF cache scan
             now = time.time()
@@ -978,11 +988,15 @@ def _daemon_main(
                     suppressed_set,
                 )
 
-            time.sleep(1)
+            # Sleep until the next scan is due, shutdown is requested, or an
+            # IPC scan request asks for an early wakeup.
+            wakeup_event.wait(max(1.0, SCAN_INTERVAL - (time.time() - last_scan_time)))
+            wakeup_event.clear()
 
         except Exception as e:
             logger.error(f"Error in daemon main loop: {e}", exc_info=True)
-            time.sleep(5)
+            wakeup_event.wait(5)
+            wakeup_event.clear()
 
     # Graceful shutdown
     logger.info("Daemon shutting down...")
@@ -5,6 +5,7 @@ Extracted from SessionContext._monitor_loop to separate the progress monitoring,
 diagnostic logging, and file delivery concerns from the torrent lifecycle management.
 """
 
+import array
 import os
 import time
 import logging
@@ -48,7 +49,12 @@ def run_monitor_loop(ctx: "SessionContext") -> None:
 
     try:
         while True:
-            time.sleep(1)
+            # Sleep until either the alert pump delivers new events for this
+            # session or the 1 s housekeeping tick elapses.  Event-driven
+            # wakeup keeps completion latency in the milliseconds instead of
+            # up to a full polling interval.
+            ctx.monitor_wakeup.wait(1.0)
+            ctx.monitor_wakeup.clear()
 
             with ctx.lock:
                 if not ctx.is_valid or not ctx.handle:
@@ -106,16 +112,19 @@ def _log_diagnostics(ctx: "SessionContext") -> None:
         return
     try:
         if handle.is_valid():
-            s = handle.status()
-            state_str = _STATE_NAMES[s.state] if s.state < len(_STATE_NAMES) else str(s.state)
-            total_pieces = ti.num_pieces() if ti else s.num_pieces
-            logger.debug(
-                f"[{ctx.repo_id}] STATUS: state={state_str} "
-                f"progress={s.progress * 100:.1f}% "
-                f"peers={s.num_peers} seeds={s.num_seeds} "
-                f"dl={s.download_rate / 1024:.1f}KB/s ul={s.upload_rate / 1024:.1f}KB/s "
-                f"pieces={s.num_pieces}/{total_pieces}"
-            )
+            s = handle.status(flags=0)
+            # The f-string below formats several floats every 5 s per session;
+            # skip it entirely unless DEBUG output is actually enabled.
+            if logger.isEnabledFor(logging.DEBUG):
+                state_str = _STATE_NAMES[s.state] if s.state < len(_STATE_NAMES) else str(s.state)
+                total_pieces = ti.num_pieces() if ti else s.num_pieces
+                logger.debug(
+                    f"[{ctx.repo_id}] STATUS: state={state_str} "
+                    f"progress={s.progress * 100:.1f}% "
+                    f"peers={s.num_peers} seeds={s.num_seeds} "
+                    f"dl={s.download_rate / 1024:.1f}KB/s ul={s.upload_rate / 1024:.1f}KB/s "
+                    f"pieces={s.num_pieces}/{total_pieces}"
+                )
             _maybe_warn_about_utp(ctx, s)
     except Exception as diag_err:
         logger.debug(f"[{ctx.repo_id}] Diagnostic log error: {diag_err}")
@@ -188,8 +197,14 @@ def _save_resume_data(ctx: "SessionContext") -> None:
     if not handle:
         return
     try:
-        if handle.is_valid():
-            handle.save_resume_data(lt.save_resume_flags_t.flush_disk_cache)
+        if not handle.is_valid():
+            return
+        # Idle sessions (e.g. background seeding with no peers) have nothing
+        # new to persist — skip the request and its disk flush.  Guarded with
+        # hasattr because older bindings do not expose the query.
+        if hasattr(handle, 'need_save_resume_data') and not handle.need_save_resume_data():
+            return
+        handle.save_resume_data(lt.save_resume_flags_t.flush_disk_cache)
     except Exception as e:
         logger.debug(f"[{ctx.repo_id}] save_resume_data error: {e}")
 
@@ -247,11 +262,10 @@ def _check_pending_files(ctx: "SessionContext") -> bool:
 
     # ── Phase 3: notify waiters and update state (lock) ───────────────
     if delivered:
-        with ctx.lock:
-            for filename in delivered:
-                if filename in ctx.file_events:
-                    ctx.file_events[filename].set()
+        for filename in delivered:
+            ctx._mark_file_completed(filename)
 
+        with ctx.lock:
             handle = ctx.handle
         if handle:
             try:
@@ -304,7 +318,7 @@ def _check_session_health(ctx: "SessionContext"):
         # Reset on recovery
         ctx._consecutive_error_ticks = 0
 
-    pending_files = [f for f, e in ctx.file_events.items() if not e.is_set()]
+    pending_files = [f for f in ctx.file_destinations if f not in ctx.completed_files]
     if not pending_files:
         return False
 
@@ -319,6 +333,7 @@ def _resolve_pending_metadata(ctx: "SessionContext") -> None:
         ctx.torrent_info_obj = ctx.handle.torrent_file()
         num_files = ctx.torrent_info_obj.num_files()
         ctx.handle.prioritize_files([0] * num_files)
+        ctx._file_priorities = array.array('B', bytes(num_files))
         logger.info(f"[{ctx.repo_id}] Background metadata resolved! {num_files} files.")
 
 
@@ -333,21 +348,20 @@ def _collect_ready_files(ctx: "SessionContext") -> list:
         return []
 
     file_progress = ctx.get_file_progress(verified_only=True)
-    files = ctx.torrent_info_obj.files()
     ready = []
 
-    pending_files = [f for f, e in ctx.file_events.items() if not e.is_set()]
+    pending_files = [f for f in ctx.file_destinations if f not in ctx.completed_files]
     for filename in pending_files:
         file_index = ctx._find_file_index(filename)
         if file_index is None:
             continue
 
-        # Query the specific file priority to avoid the deprecated list getter.
-        if ctx.handle.file_priority(file_index) == 0:
-            ctx.handle.file_priority(file_index, 1)
+        # Cached priority read: no blocking round trip per pending file per tick.
+        if ctx.get_file_priority(file_index) == 0:
+            ctx.set_file_priority(file_index, 1)
             logger.info(f"[{ctx.repo_id}] Belatedly prioritized {filename} (Index {file_index})")
 
-        file_size = files.file_size(file_index)
+        file_size = ctx._get_file_size(file_index)
         progress_bytes = file_progress[file_index]
 
         if progress_bytes == file_size and file_size > 0:
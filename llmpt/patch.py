@@ -8,21 +8,35 @@ import atexit
 import time
 import threading
 import logging
+from contextvars import ContextVar
 from typing import Optional, Any
 
 import httpx
 
 from .patch_context import (
-    apply_thread_local_context,
-    capture_thread_local_context,
+    apply_download_context,
+    capture_download_context,
     extract_context_from_stack as _extract_context_from_stack,
     extract_snapshot_context_from_stack as _extract_snapshot_context_from_stack,
     matches_snapshot_download_context as _matches_snapshot_download_context,
-    read_thread_local_context,
-    restore_thread_local_context,
+    read_download_context,
+    restore_download_context,
 )
 from . import patch_runtime as _patch_runtime
 from . import patch_ui as _patch_ui
+# Module handles (not from-imports) so test harnesses that monkeypatch
+# llmpt.utils / llmpt.transfer_coordinator attributes still take effect at
+# call time; binding them here removes the per-download import machinery
+# lookups from the hot intercept paths.
+from . import transfer_coordinator as _transfer_coordinator
+from . import utils as _utils
+from .session_context import _small_file_threshold
+from .tracker_client import _COMMIT_HASH_RE, TrackerClient
+
+try:
+    from huggingface_hub.errors import LocalEntryNotFoundError as _LocalEntryNotFoundError
+except ImportError:
+    _LocalEntryNotFoundError = None
 
 logger = logging.getLogger('llmpt.patch')
 
@@ -35,8 +49,8 @@ _original_snapshot_hf_tqdm = None
 # Patching configuration (set by apply_patch)
 _config = {}
 
-# Thread-local storage for P2P context
-_context = threading.local()
+# Per-download P2P context (one dict per thread/task; None outside a download)
+_context: "ContextVar[Optional[dict]]" = ContextVar('llmpt_p2p_context', default=None)
 
 # Download statistics: tracks which files went through P2P vs HTTP fallback
 _stats_lock = threading.Lock()
@@ -151,19 +165,13 @@ def _iter_exception_chain(exc: BaseException):
 
 def _is_retryable_hf_metadata_error(exc: BaseException) -> bool:
     """Return True when the failure came from transient HF metadata I/O."""
-    try:
-        from huggingface_hub.errors import LocalEntryNotFoundError
-    except ImportError:
-        LocalEntryNotFoundError = tuple()  # type: ignore[assignment]
-
     retryable_roots = (
         httpx.ConnectError,
         httpx.TimeoutException,
     )
-    wrapper_types = (
-        ValueError,
-        LocalEntryNotFoundError,
-    )
+    wrapper_types: tuple = (ValueError,)
+    if _LocalEntryNotFoundError is not None:
+        wrapper_types = wrapper_types + (_LocalEntryNotFoundError,)
 
     saw_wrapper = False
     for candidate in _iter_exception_chain(exc):
@@ -422,17 +430,133 @@ def _notify_seed_daemon(
     )
 
 
+# Shared TrackerClient per tracker URL.  A snapshot download calls
+# _patched_hf_hub_download once per file; sharing one client keeps its pooled
+# keep-alive connections across the whole batch instead of building a fresh
+# requests.Session per file.  A dict (rather than lru_cache) so disable_p2p
+# can close the pooled connections explicitly.
+_tracker_clients: dict = {}
+_tracker_clients_lock = threading.Lock()
+
+
+def _get_tracker_client(tracker_url: str):
+    """Return the shared TrackerClient for *tracker_url*."""
+    with _tracker_clients_lock:
+        client = _tracker_clients.get(tracker_url)
+        if client is None:
+            client = TrackerClient(tracker_url)
+            _tracker_clients[tracker_url] = client
+        return client
+
+
+def _close_tracker_clients() -> None:
+    """Close and drop all shared tracker clients (used on disable_p2p)."""
+    with _tracker_clients_lock:
+        clients = list(_tracker_clients.values())
+        _tracker_clients.clear()
+    for client in clients:
+        client.close()
+
+
+# Torrent-info prefetching: the tracker lookup and hf_hub_download's own
+# HEAD/metadata requests are independent network operations, so overlap them
+# instead of paying for both sequentially.  Futures are deduplicated per
+# (tracker_url, repo_type, repo_id, revision) so a snapshot's worker threads
+# share one in-flight query; the result lands in the tracker client's
+# torrent-info cache, which the planner consults later.
+_PREFETCH_MAX_WORKERS = 16
+_PREFETCH_JOIN_TIMEOUT = 5.0
+_prefetch_lock = threading.Lock()
+_prefetch_executor = None
+_prefetch_futures: dict[tuple[str, str, str, str], Any] = {}
+
+
+def _submit_torrent_prefetch(tracker, repo_id: str, revision: str, repo_type: str):
+    """Start a background torrent-info lookup; returns its Future (or None).
+
+    Only commit-hash revisions are prefetched — those are the only lookups
+    the tracker client caches, so anything else would just duplicate the
+    query the planner issues anyway.
+    """
+    if not _COMMIT_HASH_RE.match(revision or ''):
+        return None
+
+    global _prefetch_executor
+    key = (tracker.tracker_url, repo_type, repo_id, revision)
+    with _prefetch_lock:
+        future = _prefetch_futures.get(key)
+        if future is not None:
+            return future
+        if _prefetch_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _prefetch_executor = ThreadPoolExecutor(
+                max_workers=_PREFETCH_MAX_WORKERS,
+                thread_name_prefix='llmpt-prefetch',
+            )
+        future = _prefetch_executor.submit(
+            tracker.get_torrent_info,
+            repo_id,
+            revision,
+            repo_type=repo_type,
+        )
+        _prefetch_futures[key] = future
+        return future
+
+
+def _shutdown_prefetch_executor() -> None:
+    """Drop pending prefetches and release the executor (used on remove_patch)."""
+    global _prefetch_executor
+    with _prefetch_lock:
+        executor = _prefetch_executor
+        _prefetch_executor = None
+        _prefetch_futures.clear()
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _prefetch_snapshot_file_sources(
+    repo_id: str,
+    revision: str,
+    repo_type: str,
+    snapshot_kwargs: dict,
+) -> None:
+    """Batch-resolve tracker file sources for a whole snapshot up front.
+
+    snapshot_download fans out into one hf_hub_download per file; without
+    prefetching, each file costs one /file-sources tracker round-trip during
+    transfer planning.  One repo listing plus one batched tracker query
+    replaces all of them.  Best-effort: on any failure (old tracker, network
+    error) the per-file lookup path stays in place unchanged.
+    """
+    tracker_url = _config.get('tracker_url')
+    if not tracker_url:
+        return
+
+    from huggingface_hub import list_repo_files
+
+    filenames = list_repo_files(
+        repo_id,
+        revision=revision,
+        repo_type=repo_type,
+        token=snapshot_kwargs.get('token'),
+    )
+    if filenames:
+        _get_tracker_client(tracker_url).prefetch_file_sources(
+            repo_id,
+            revision,
+            filenames,
+            repo_type=repo_type,
+        )
+
+
 def _patched_hf_hub_download(repo_id: str, filename: str, **kwargs):
     """Patched version of hf_hub_download that injects P2P context."""
-    from .tracker_client import TrackerClient
-    from .utils import resolve_commit_hash
-
     # Track active downloads so the deferred summary waits for all to finish.
     with _deferred_lock:
         _active_download_counts[repo_id] = _active_download_counts.get(repo_id, 0) + 1
 
     # Query tracker for torrent info
-    tracker = TrackerClient(_config['tracker_url'])
+    tracker = _get_tracker_client(_config['tracker_url'])
 
     # Resolve revision to a 40-char commit hash so the tracker query matches
     # what seeders registered.  If resolution fails (e.g. network error),
@@ -442,9 +566,9 @@ def _patched_hf_hub_download(repo_id: str, filename: str, **kwargs):
     cache_dir = kwargs.get('cache_dir')
     local_dir = kwargs.get('local_dir')
     try:
-        revision = resolve_commit_hash(repo_id, raw_revision, repo_type=repo_type)
+        revision = _utils.resolve_commit_hash(repo_id, raw_revision, repo_type=repo_type)
     except Exception as e:
-        logger.debug(f"[P2P] Could not resolve revision '{raw_revision}': {e}")
+        logger.debug("[P2P] Could not resolve revision %r: %s", raw_revision, e)
         revision = raw_revision
 
     # Resolve subfolder exactly as huggingface_hub does
@@ -455,17 +579,22 @@ def _patched_hf_hub_download(repo_id: str, filename: str, **kwargs):
     if subfolder is not None:
         actual_filename = f"{subfolder}/{filename}"
 
+    # Kick off the tracker lookup now so it overlaps the HEAD/metadata
+    # requests the original hf_hub_download is about to make.
+    torrent_future = _submit_torrent_prefetch(tracker, repo_id, revision, repo_type)
+
     # Backup previous context (in case of nested/recursive hf_hub_download calls)
-    prev_context = capture_thread_local_context(_context)
+    prev_context = capture_download_context(_context)
 
     # Store context for http_get to use
-    apply_thread_local_context(
+    apply_download_context(
         _context,
         repo_id=repo_id,
         repo_type=repo_type,
         filename=actual_filename,
         revision=revision,
         tracker=tracker,
+        torrent_future=torrent_future,
         config=_config,
         cache_dir=cache_dir,
         local_dir=local_dir,
@@ -484,7 +613,7 @@ def _patched_hf_hub_download(repo_id: str, filename: str, **kwargs):
         return result
     finally:
         # Restore previous context instead of clearing it (supports recursion)
-        restore_thread_local_context(_context, prev_context)
+        restore_download_context(_context, prev_context)
 
         # Decrement active download counter.
         with _deferred_lock:
@@ -522,7 +651,7 @@ def _patched_hf_hub_download(repo_id: str, filename: str, **kwargs):
                         **notify_kwargs,
                     )
                 except Exception as e:
-                    logger.debug(f"[P2P] Immediate daemon notification failed: {e}")
+                    logger.debug("[P2P] Immediate daemon notification failed: %s", e)
             _release_on_demand_session(
                 repo_id=repo_id,
                 revision=revision,
@@ -536,12 +665,13 @@ def _patched_hf_hub_download(repo_id: str, filename: str, **kwargs):
 def _patched_http_get(url: str, temp_file, **kwargs):
     """Patched version of http_get that uses P2P batch manager when available."""
     # Check if we have P2P context (injected by patched hf_hub_download)
-    current_context = read_thread_local_context(_context)
+    current_context = read_download_context(_context)
     repo_id = current_context.get('repo_id') if current_context else None
     repo_type = current_context.get('repo_type', 'model') if current_context else 'model'
     filename = current_context.get('filename') if current_context else None
     revision = current_context.get('revision') if current_context else None
     tracker = current_context.get('tracker') if current_context else None
+    torrent_future = current_context.get('torrent_future') if current_context else None
     config = current_context.get('config', {}) if current_context else {}
     cache_dir = current_context.get('cache_dir') if current_context else None
     local_dir = current_context.get('local_dir') if current_context else None
@@ -555,18 +685,19 @@ def _patched_http_get(url: str, temp_file, **kwargs):
     if not (repo_id and filename and revision):
         stack_ctx = _extract_context_from_stack()
         if stack_ctx:
-            from .tracker_client import TrackerClient
             repo_id = stack_ctx['repo_id']
             filename = stack_ctx['filename']
             revision = stack_ctx['revision']
             repo_type = stack_ctx['repo_type']
             cache_dir = stack_ctx.get('cache_dir')
             local_dir = stack_ctx.get('local_dir')
-            tracker = TrackerClient(_config['tracker_url']) if _config.get('tracker_url') else None
+            tracker = _get_tracker_client(_config['tracker_url']) if _config.get('tracker_url') else None
             config = _config
             logger.debug(
-                f"[P2P] Recovered context from stack frame: "
-                f"{repo_id}/{filename}@{revision[:8]}..."
+                "[P2P] Recovered context from stack frame: %s/%s@%s...",
+                repo_id,
+                filename,
+                revision[:8],
             )
 
             # Since we bypassed _patched_hf_hub_download, we must schedule the
@@ -584,12 +715,41 @@ def _patched_http_get(url: str, temp_file, **kwargs):
             local_dir=local_dir,
         )
 
+    # Tiny files (.gitattributes, config.json, tokenizer files): a single HTTP
+    # GET beats the tracker round-trip and swarm join, so skip P2P before any
+    # torrent work happens.  huggingface_hub passes the blob size down as
+    # expected_size; when it is absent, SessionContext applies the same
+    # threshold once torrent metadata is available.
+    expected_size = kwargs.get('expected_size')
+    small_file_cutoff = _small_file_threshold()
+    if (
+        filename
+        and expected_size
+        and 0 < expected_size < small_file_cutoff
+    ):
+        logger.debug(
+            "[P2P] %s is %d B (< %d B); downloading via HTTP directly.",
+            filename,
+            expected_size,
+            small_file_cutoff,
+        )
+        tracker = None
+
     if repo_id and filename and tracker and revision:
+        # Join the background torrent-info lookup started in
+        # _patched_hf_hub_download so planning hits a warm cache.  A short
+        # timeout keeps a stuck tracker from delaying the HTTP fallback; on
+        # timeout the planner simply performs its own lookup.
+        if torrent_future is not None:
+            try:
+                torrent_future.result(timeout=_PREFETCH_JOIN_TIMEOUT)
+            except Exception as e:
+                logger.debug("[P2P] Torrent-info prefetch did not complete: %s", e)
+
         try:
-            from .transfer_coordinator import TransferCoordinator
-            logger.info(f"[P2P] Intercepted HTTP request for {repo_id}/{filename} (rev: {revision})")
+            logger.info("[P2P] Intercepted HTTP request for %s/%s (rev: %s)", repo_id, filename, revision)
 
-            coordinator = TransferCoordinator()
+            coordinator = _transfer_coordinator.TransferCoordinator()
             transfer = coordinator.fulfill_request(
                 repo_id=repo_id,
                 revision=revision,
@@ -604,7 +764,7 @@ def _patched_http_get(url: str, temp_file, **kwargs):
             )
 
             if transfer.success:
-                logger.info(f"[P2P] Successfully delivered {filename} via P2P.")
+                logger.info("[P2P] Successfully delivered %s via P2P.", filename)
                 if stats_key is not None:
                     _record_download_stat(stats_key, 'p2p', filename)
                 if schedule_deferred:
@@ -618,10 +778,10 @@ def _patched_http_get(url: str, temp_file, **kwargs):
                     )
                 return  # Skip original http_get completely!
             else:
-                logger.warning(f"[P2P] P2P fulfillment failed for {filename}. Falling back to HTTP.")
+                logger.warning("[P2P] P2P fulfillment failed for %s. Falling back to HTTP.", filename)
 
         except Exception as e:
-            logger.warning(f"[P2P] Exception in P2P intercept: {e}. Falling back to HTTP.")
+            logger.warning("[P2P] Exception in P2P intercept: %s. Falling back to HTTP.", e)
 
     # Fall back to original HTTP download if P2P failed or unavailable.
     # Preserve HuggingFace's native resume_size so interrupted HTTP transfers
@@ -693,11 +853,16 @@ def _patched_snapshot_download(*args, **kwargs):
             hf_tqdm_lib = None
 
         try:
-            from .utils import resolve_commit_hash
-            resolved = resolve_commit_hash(repo_id, revision, repo_type=repo_type)
+            resolved = _utils.resolve_commit_hash(repo_id, revision, repo_type=repo_type)
         except Exception:
             resolved = revision
 
+        if not kwargs.get('dry_run', False):
+            try:
+                _prefetch_snapshot_file_sources(repo_id, resolved, repo_type, kwargs)
+            except Exception as e:
+                logger.debug(f"[P2P] Snapshot file-source prefetch failed: {e}")
+
         base_tqdm_class = kwargs.get('tqdm_class') or hf_tqdm_lib
         if base_tqdm_class is not None and not kwargs.get('dry_run', False):
             kwargs = {
@@ -911,6 +1076,7 @@ def remove_patch() -> None:
             _deferred_contexts.clear()
             _active_wrapper_counts.clear()
             _active_download_counts.clear()
+        _shutdown_prefetch_executor()
         reset_download_stats()
 
         logger.debug("Monkey patch removed successfully")
@@ -1,74 +1,71 @@
-"""Helpers for patch-layer download context management."""
+"""Helpers for patch-layer download context management.
+
+The per-download context lives in a single :class:`~contextvars.ContextVar`
+holding one dict.  Compared with the previous ``threading.local()`` with one
+attribute per field, this is one HAMT lookup per read instead of several
+``getattr`` calls, and it stays correct when huggingface_hub runs downloads
+through asyncio tasks rather than plain threads.
+"""
 
 import sys
+from contextvars import ContextVar
 from typing import Any, Optional
 
 from .session_identity import normalize_storage_root
 
 
-_CONTEXT_FIELDS = (
-    "repo_id",
-    "repo_type",
-    "filename",
-    "revision",
-    "tracker",
-    "config",
-    "cache_dir",
-    "local_dir",
-)
-
+def capture_download_context(
+    context_var: "ContextVar[Optional[dict[str, Any]]]",
+) -> Optional[dict[str, Any]]:
+    """Snapshot the current download context for later restoration."""
+    return context_var.get()
 
-def capture_thread_local_context(context_local) -> dict[str, Any]:
-    """Snapshot the patch thread-local state for later restoration."""
-    return {
-        field: getattr(context_local, field, None)
-        for field in _CONTEXT_FIELDS
-    }
 
-
-def apply_thread_local_context(
-    context_local,
+def apply_download_context(
+    context_var: "ContextVar[Optional[dict[str, Any]]]",
     *,
     repo_id: Optional[str] = None,
     repo_type: Optional[str] = None,
     filename: Optional[str] = None,
     revision: Optional[str] = None,
     tracker: Any = None,
+    torrent_future: Any = None,
     config: Optional[dict[str, Any]] = None,
     cache_dir: Optional[str] = None,
     local_dir: Optional[str] = None,
 ) -> None:
-    """Install a new patch thread-local context."""
-    context_local.repo_id = repo_id
-    context_local.repo_type = repo_type
-    context_local.filename = filename
-    context_local.revision = revision
-    context_local.tracker = tracker
-    context_local.config = config
-    context_local.cache_dir = cache_dir
-    context_local.local_dir = local_dir
-
-
-def restore_thread_local_context(context_local, snapshot: dict[str, Any]) -> None:
-    """Restore a previously captured patch thread-local context."""
-    apply_thread_local_context(
-        context_local,
-        repo_id=snapshot.get("repo_id"),
-        repo_type=snapshot.get("repo_type"),
-        filename=snapshot.get("filename"),
-        revision=snapshot.get("revision"),
-        tracker=snapshot.get("tracker"),
-        config=snapshot.get("config"),
-        cache_dir=snapshot.get("cache_dir"),
-        local_dir=snapshot.get("local_dir"),
-    )
-
-
-def read_thread_local_context(context_local) -> Optional[dict[str, Any]]:
-    """Read the current patch thread-local context if it is complete enough."""
-    context = capture_thread_local_context(context_local)
+    """Install a new download context for the current thread/task."""
+    context_var.set({
+        "repo_id": repo_id,
+        "repo_type": repo_type,
+        "filename": filename,
+        "revision": revision,
+        "tracker": tracker,
+        "torrent_future": torrent_future,
+        "config": config,
+        "cache_dir": cache_dir,
+        "local_dir": local_dir,
+    })
+
+
+def restore_download_context(
+    context_var: "ContextVar[Optional[dict[str, Any]]]",
+    snapshot: Optional[dict[str, Any]],
+) -> None:
+    """Restore a previously captured download context."""
+    context_var.set(snapshot)
+
+
+def read_download_context(
+    context_var: "ContextVar[Optional[dict[str, Any]]]",
+) -> Optional[dict[str, Any]]:
+    """Read the current download context if it is complete enough."""
+    context = context_var.get()
+    if not context:
+        return None
     if not (context.get("repo_id") and context.get("filename") and context.get("revision")):
         return None
+    context = dict(context)
     context["repo_type"] = context.get("repo_type") or "model"
     context["config"] = context.get("config") or {}
     return context
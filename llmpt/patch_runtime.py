@@ -10,6 +10,10 @@ from .utils import get_hf_hub_cache
 
 StatsKey = tuple[str, str, str, str, str]
 
+# Quiet period before the deferred daemon notification fires.  Module-level
+# so tests can shrink it instead of sleeping through the real debounce.
+_DEFERRED_DEBOUNCE_SECONDS = 2.0
+
 
 def snapshot_stats_key(
     repo_id: str,
@@ -247,7 +251,7 @@ def fire_deferred_notification(
             old_timer = deferred_timers.pop(key, None)
             if old_timer is not None:
                 old_timer.cancel()
-            new_timer = timer_factory(2.0, fire_deferred_notification, args=[key], kwargs={
+            new_timer = timer_factory(_DEFERRED_DEBOUNCE_SECONDS, fire_deferred_notification, args=[key], kwargs={
                 "deferred_lock": deferred_lock,
                 "deferred_contexts": deferred_contexts,
                 "deferred_timers": deferred_timers,
@@ -355,7 +359,7 @@ def schedule_deferred_notification(
             "start_time": existing["start_time"] if existing else time.time(),
         }
 
-        new_timer = timer_factory(2.0, fire_deferred_notification_fn, args=[key])
+        new_timer = timer_factory(_DEFERRED_DEBOUNCE_SECONDS, fire_deferred_notification_fn, args=[key])
         new_timer.daemon = True
         new_timer.start()
         deferred_timers[key] = new_timer
@@ -8,13 +8,17 @@ without duplicating data on disk.
 
 import os
 import logging
-import time
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
-from .utils import lt, strip_torrent_root
+from .utils import strip_torrent_root
 
 logger = logging.getLogger(__name__)
 
+# Cache lookups are stat()-bound; overlapping them hides per-file syscall
+# latency when mapping repos with hundreds of shards.
+_CACHE_RESOLVE_MAX_WORKERS = 16
+
 
 # ── HF cache resolution ──────────────────────────────────────────────────────
 
@@ -69,6 +73,38 @@ def create_padding_file(expected_path: str, size: int) -> None:
             f.truncate(size)
 
 
+def _resolve_blobs_parallel(
+    entries: List[Tuple[int, str]],
+    repo_id: str,
+    revision: str,
+    *,
+    repo_type: str = "model",
+    cache_dir: Optional[str] = None,
+    local_dir: Optional[str] = None,
+) -> Dict[int, Optional[str]]:
+    """Resolve HF cache blobs for many files with overlapping stat() calls.
+
+    Args:
+        entries: ``(file_index, target_norm)`` pairs for non-padding files.
+
+    Returns:
+        Dict mapping file_index -> resolved blob path (or None on cache miss).
+    """
+    def resolve(entry: Tuple[int, str]) -> Optional[str]:
+        return resolve_hf_blob(
+            repo_id, entry[1], revision,
+            repo_type=repo_type, cache_dir=cache_dir, local_dir=local_dir,
+        )
+
+    if len(entries) <= 1:
+        return {idx: resolve((idx, norm)) for idx, norm in entries}
+
+    workers = min(_CACHE_RESOLVE_MAX_WORKERS, len(entries))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        resolved = list(executor.map(resolve, entries))
+    return {entry[0]: path for entry, path in zip(entries, resolved)}
+
+
 # ── Hardlink strategy (fast seed_mode startup) ───────────────────────────────
 
 def hardlink_files_for_seeding(
@@ -101,11 +137,20 @@ def hardlink_files_for_seeding(
     hardlinks: List[str] = []
     mapped_count = 0
 
+    entries = []  # (file_index, lt_path, file_size, target_norm)
     for file_index in range(files.num_files()):
         lt_path = files.file_path(file_index).replace('\\', '/')
-        file_size = files.file_size(file_index)
-        target_norm = strip_torrent_root(lt_path)
+        entries.append((
+            file_index, lt_path, files.file_size(file_index), strip_torrent_root(lt_path),
+        ))
+
+    # Resolve all cache blobs upfront so the stat() syscalls overlap.
+    resolved = _resolve_blobs_parallel(
+        [(idx, norm) for idx, _, _, norm in entries if not is_padding_file(norm)],
+        repo_id, revision, repo_type=repo_type, cache_dir=cache_dir, local_dir=local_dir,
+    )
 
+    for file_index, lt_path, file_size, target_norm in entries:
         # Handle padding files
         if is_padding_file(target_norm):
             expected_path = os.path.join(temp_dir, lt_path)
@@ -114,8 +159,7 @@ def hardlink_files_for_seeding(
             logger.info(f"[{repo_id}] Created padding file [{file_index}]: {target_norm} ({file_size} bytes)")
             continue
 
-        # Resolve the HF cache blob path
-        real_path = resolve_hf_blob(repo_id, target_norm, revision, repo_type=repo_type, cache_dir=cache_dir, local_dir=local_dir)
+        real_path = resolved.get(file_index)
         if not real_path:
             logger.warning(f"[{repo_id}] Cache miss for seeding [{file_index}]: {target_norm} (revision={revision})")
             continue
@@ -149,11 +193,12 @@ def rename_files_for_seeding(
     cache_dir: Optional[str] = None,
     local_dir: Optional[str] = None,
 ) -> int:
-    """Map files via rename_file() and trigger a force_recheck().
+    """Map files via rename_file() pointing libtorrent at the HF blobs.
 
-    This is the fallback when hardlinks fail (cross-filesystem).
-    It requires a full SHA1 verification of all pieces, which can
-    take minutes for large models.
+    This is the fallback when hardlinks fail (cross-filesystem).  The
+    caller decides how to start seeding afterwards (a background
+    force_recheck when the mapping is complete); no recheck is triggered
+    or waited on here.
 
     Args:
         handle: libtorrent torrent handle.
@@ -168,22 +213,27 @@ def rename_files_for_seeding(
     files = torrent_info.files()
     mapped_count = 0
 
+    entries = []  # (file_index, lt_path, file_size, target_norm)
     for file_index in range(files.num_files()):
         lt_path = files.file_path(file_index).replace('\\', '/')
-        file_size = files.file_size(file_index)
-        target_norm = strip_torrent_root(lt_path)
+        entries.append((
+            file_index, lt_path, files.file_size(file_index), strip_torrent_root(lt_path),
+        ))
 
+    resolved = _resolve_blobs_parallel(
+        [(idx, norm) for idx, _, _, norm in entries if not is_padding_file(norm)],
+        repo_id, revision, repo_type=repo_type, cache_dir=cache_dir, local_dir=local_dir,
+    )
+
+    for file_index, lt_path, file_size, target_norm in entries:
         if is_padding_file(target_norm):
             pad_dir = os.path.join(temp_dir, ".pad_files")
-            os.makedirs(pad_dir, exist_ok=True)
             pad_file_path = os.path.join(pad_dir, f"pad_{file_index}_{file_size}")
-            if not os.path.exists(pad_file_path):
-                with open(pad_file_path, 'wb') as f:
-                    f.write(b'\x00' * file_size)
+            create_padding_file(pad_file_path, file_size)
             handle.rename_file(file_index, pad_file_path)
             continue
 
-        real_path = resolve_hf_blob(repo_id, target_norm, revision, repo_type=repo_type, cache_dir=cache_dir, local_dir=local_dir)
+        real_path = resolved.get(file_index)
         if real_path:
             handle.rename_file(file_index, real_path)
             mapped_count += 1
@@ -191,27 +241,7 @@ def rename_files_for_seeding(
         else:
             logger.warning(f"[{repo_id}] [legacy] Cache miss [{file_index}]: {target_norm}")
 
-    logger.info(f"[{repo_id}] [legacy] Mapped {mapped_count}/{files.num_files()} files. Starting force_recheck...")
-
-    handle.resume()
-    handle.force_recheck()
-
-    # Wait for recheck (no hard timeout — large models can take 10+ min on HDD)
-    recheck_start = time.time()
-    last_log_time = 0.0
-    while True:
-        s = handle.status()
-        if s.state not in (1, 7):
-            elapsed = time.time() - recheck_start
-            logger.info(f"[{repo_id}] [legacy] Recheck complete in {elapsed:.0f}s. Pieces: {s.num_pieces}")
-            break
-        now = time.time()
-        if now - last_log_time >= 10:
-            last_log_time = now
-            elapsed = now - recheck_start
-            logger.info(f"[{repo_id}] [legacy] Rechecking... {s.progress*100:.1f}% ({elapsed:.0f}s)")
-        time.sleep(0.5)
-
+    logger.info(f"[{repo_id}] [legacy] Mapped {mapped_count}/{files.num_files()} files.")
     return mapped_count
 
 
@@ -6,13 +6,26 @@ HuggingFace repository/revision pair: initialization, file download orchestratio
 seeding file mapping, and background progress monitoring.
 """
 
+import array
 import os
 import shutil
 import threading
 import time
 import logging
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX platforms
+    fcntl = None
+
+# Module handle (not a from-import) so test harnesses that monkeypatch
+# huggingface_hub.utils attributes still take effect at call time.
+try:
+    from huggingface_hub import utils as _hf_utils
+except ImportError:
+    _hf_utils = None
 from collections import deque
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 if TYPE_CHECKING:
     from .tracker_client import TrackerClient
@@ -31,6 +44,102 @@ logger = logging.getLogger(__name__)
 
 _TIMEOUT_DELIVERY_GRACE_SECONDS = 1.0
 
+# Files below this size are cheaper over plain HTTP than through the P2P
+# machinery (priority update, 1 s monitor granularity, delivery copy), so
+# download_file declines them and lets the caller fall back.  Override via
+# HF_P2P_SMALL_FILE_THRESHOLD (bytes; 0 disables the fast path).
+_DEFAULT_SMALL_FILE_THRESHOLD_BYTES = 1024 * 1024
+
+
+def _small_file_threshold() -> int:
+    """Return the small-file HTTP fast-path threshold in bytes."""
+    try:
+        return int(os.environ.get(
+            'HF_P2P_SMALL_FILE_THRESHOLD', _DEFAULT_SMALL_FILE_THRESHOLD_BYTES
+        ))
+    except ValueError:
+        return _DEFAULT_SMALL_FILE_THRESHOLD_BYTES
+
+# Chunk size for kernel-level file copies. Large enough to amortize syscall
+# overhead, small enough to keep RSS bounded for multi-GB model shards.
+_SENDFILE_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+# FICLONE ioctl request: metadata-only clone of all extents (reflink on
+# btrfs/XFS).  Constant from <linux/fs.h>; not exposed by the fcntl module.
+_FICLONE = 0x40049409
+
+
+def _clone_or_copy_fds(src_fd: int, dst_fd: int) -> bool:
+    """Transfer *src_fd*'s contents to *dst_fd* entirely inside the kernel.
+
+    Tries, in order of decreasing cheapness:
+      1. ``FICLONE`` ioctl — O(1) extent clone on reflink filesystems,
+         no data movement at all.
+      2. ``os.copy_file_range`` — kernel copy that filesystems may
+         accelerate (server-side copy, extent sharing).
+      3. ``os.sendfile`` — plain kernel copy, no userspace bounce buffer.
+
+    Returns True when the full file was transferred, False when no
+    mechanism is usable (caller falls back to ``shutil.copy2``).
+    """
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return True
+        except OSError:
+            pass
+
+    size = os.fstat(src_fd).st_size
+    for name in ("copy_file_range", "sendfile"):
+        copier = getattr(os, name, None)
+        if copier is None:
+            continue
+        # A failed previous attempt may have left partial data behind and
+        # both file offsets advanced; rewind and truncate so each mechanism
+        # starts from a clean destination instead of appending after (or
+        # re-reading past) the partial copy.
+        try:
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+        except OSError:
+            return False
+        try:
+            remaining = size
+            offset = 0
+            while remaining > 0:
+                count = min(remaining, _SENDFILE_CHUNK_BYTES)
+                if name == "copy_file_range":
+                    sent = copier(src_fd, dst_fd, count)
+                else:
+                    sent = copier(dst_fd, src_fd, offset, count)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+            if remaining == 0:
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _kernel_copy_file(src: str, dst: str) -> None:
+    """Copy *src* to *dst* without staging file data in Python memory.
+
+    Prefers kernel-side mechanisms (reflink clone, copy_file_range,
+    sendfile) via :func:`_clone_or_copy_fds`; falls back to
+    ``shutil.copy2`` on platforms or filesystems where none apply.
+    """
+    try:
+        with open(src, "rb") as src_f, open(dst, "wb") as dst_f:
+            if _clone_or_copy_fds(src_f.fileno(), dst_f.fileno()):
+                return
+    except OSError:
+        pass
+    shutil.copy2(src, dst)
+
 
 def _is_webseed_peer(peer, *, webseed_enabled: bool) -> bool:
     """Return True when libtorrent reports an HTTP/WebSeed connection.
@@ -131,16 +240,49 @@ class SessionContext:
         self.is_valid = True
         self.temp_dir = ""
         self.torrent_info_obj = None # libtorrent torrent_info object
+        # Lazily-built filename -> file index map and per-index size cache
+        # (torrent metadata is immutable, so one pass over file_storage
+        # serves every later lookup).
+        self._index_by_filename: Optional[Dict[str, int]] = None
+        self._file_sizes: List[int] = []
+        # Python-side copy of the per-file priority vector.  Every
+        # file_priority() call crosses into libtorrent's network thread, so
+        # reads are served from this cache and writes are skipped when the
+        # value is unchanged.  Stored as array.array('B') — one byte per file
+        # mutated in place, instead of reallocating a list of boxed ints on
+        # every update.  Empty for full_seed sessions (no on-demand
+        # priorities are managed there).
+        self._file_priorities: array.array = array.array('B')
         
         self.lock = threading.Lock()
-        # Maps filename -> threading.Event (to notify completion)
-        self.file_events: Dict[str, threading.Event] = {}
+        # Serializes torrent initialization separately from self.lock:
+        # _init_torrent can spend seconds fetching .torrent data from the
+        # tracker, and holding self.lock that long would stall the monitor
+        # thread and every status/stats reader.
+        self._init_lock = threading.Lock()
+        # Completion signalling: one condition + a set of delivered filenames
+        # instead of a threading.Event per requested file.  Waiters block on
+        # the shared condvar and the monitor publishes a whole sweep of
+        # completions with a single notify_all().  The condition has its own
+        # lock (not self.lock) so completion can be marked from code paths
+        # that already hold self.lock.
+        self.completion_cond = threading.Condition()
+        self.completed_files: set = set()
+        # Maps filename -> destination path; keys double as the pending set
+        # (pending = requested and not yet in completed_files).
         self.file_destinations: Dict[str, str] = {}
+        # Destination directories already created — an HF snapshot delivers
+        # hundreds of files into a handful of directories, so skip the
+        # redundant makedirs stat+mkdir per delivery.
+        self._ensured_dirs: set = set()
         
         # Thread-safe alert-event inbox: populated by the manager-owned alert
         # pump, consumed by the monitor thread via _process_alerts().
         self.alert_lock = threading.Lock()
         self.pending_alerts: deque = deque()
+        # Set by the alert pump when new events land in pending_alerts, so the
+        # monitor thread can react immediately instead of waiting out its tick.
+        self.monitor_wakeup = threading.Event()
         
         # Determine paths for fastresume data
         self.fastresume_dir = os.path.expanduser("~/.cache/llmpt/p2p_resume")
@@ -172,6 +314,10 @@ class SessionContext:
         self.seeding_total_files: int = 0
         self.full_mapping: bool = False
         self.seeding_hardlinks = []
+        # Plain-dict status snapshot written by the manager's alert pump from
+        # state_update_alert; lets status readers avoid per-torrent
+        # handle.status() round trips.
+        self.last_status: Optional[dict] = None
 
     def get_file_progress(self, *, verified_only: bool = False):
         """Return file progress, optionally counting only hash-verified pieces."""
@@ -182,6 +328,37 @@ class SessionContext:
             flags = lt.torrent_handle.piece_granularity
         return self.handle.file_progress(flags)
 
+    def get_file_priority(self, file_index: int) -> int:
+        """Return a file's priority from the local cache when possible.
+
+        Falls back to a blocking ``handle.file_priority()`` read only when no
+        cached vector exists (e.g. full_seed sessions).
+        """
+        if self._file_priorities and 0 <= file_index < len(self._file_priorities):
+            return self._file_priorities[file_index]
+        return self.handle.file_priority(file_index)
+
+    def set_file_priority(self, file_index: int, priority: int) -> None:
+        """Set a file's priority, skipping the libtorrent call when unchanged."""
+        if self._file_priorities and 0 <= file_index < len(self._file_priorities):
+            if self._file_priorities[file_index] == priority:
+                return
+            self._file_priorities[file_index] = priority
+        self.handle.file_priority(file_index, priority)
+
+    def _ensure_init_torrent(self, initial_filename: str = None) -> bool:
+        """Initialize the torrent exactly once, outside self.lock.
+
+        Concurrent callers serialize on the dedicated init lock; all but the
+        first return immediately once the handle exists.  Keeping the slow
+        acquisition (tracker HTTP + add_torrent) off self.lock means the
+        monitor thread and stats readers are never blocked behind network I/O.
+        """
+        with self._init_lock:
+            if self.handle is not None:
+                return True
+            return self._init_torrent(initial_filename)
+
     def _init_torrent(self, initial_filename: str = None) -> bool:
         """Initialize the libtorrent handle if not already done."""
         if self.handle is not None:
@@ -219,7 +396,6 @@ class SessionContext:
             )
             
             if self.session_mode == 'on_demand' and info is not None:
-                from .utils import strip_torrent_root
                 priorities = [0] * info.num_files()
                 if initial_filename:
                     files = info.files()
@@ -228,6 +404,7 @@ class SessionContext:
                             priorities[i] = 1
                             break
                 params.file_priorities = priorities
+                self._file_priorities = array.array('B', priorities)
 
             self.handle = self.lt_session.add_torrent(params)
 
@@ -338,39 +515,52 @@ class SessionContext:
         combined with force_recheck), we let libtorrent download to its default
         save_path and then copy/move the completed file to the HF destination.
         """
+        if not self.is_valid:
+            return False
+
+        # Initialize torrent, but don't abort file tracking just because it timed out!
+        # A timeout (Returns False) means we still have a valid handle in the background
+        # trying to get metadata, so we MUST track the file for fastresume mapping!
+        # Runs outside self.lock — initialization may block on tracker I/O.
+        init_success = self._ensure_init_torrent(filename)
+        if not init_success and not self.is_valid:
+            return False
+
         with self.lock:
             if not self.is_valid:
                 return False
-                
-            # Initialize torrent, but don't abort file tracking just because it timed out!
-            # A timeout (Returns False) means we still have a valid handle in the background 
-            # trying to get metadata, so we MUST track the file for fastresume mapping!
-            init_success = self._init_torrent(filename)
-            if not init_success and not self.is_valid:
-                return False
-            
-            event = self.file_events.get(filename)
-            if not event:
-                event = threading.Event()
-                self.file_events[filename] = event
+
+            if filename not in self.file_destinations:
                 self.file_destinations[filename] = destination
-                
+
                 # Try finding the file. BUT, if torrent_info_obj is None because we 
                 # fell back to HTTP during metadata fetch, we just queue it up and
                 # let the monitor thread prioritize it once metadata arrives!
                 file_index = self._find_file_index(filename)
                 if file_index is not None:
+                    # Small-file fast path: HTTP beats the P2P round trip for
+                    # tiny files (config.json etc.) unless the data is already
+                    # on disk because the torrent finished.
+                    file_size = self._get_file_size(file_index)
+                    threshold = _small_file_threshold()
+                    if 0 < file_size < threshold and self.handle.status().state not in (4, 5):
+                        logger.info(
+                            f"[{self.repo_id}] {filename} is {file_size} B (< {threshold} B). Skipping P2P, using HTTP."
+                        )
+                        del self.file_destinations[filename]
+                        return False
+
                     # Don't rename_file()! Let libtorrent download to its default path.
                     # We only set priority to request this file. The monitor loop will
                     # copy the data to `destination` once the file is complete.
                     logger.info(f"[{self.repo_id}] Requesting file {filename} (Index {file_index}). Priority -> 1. Destination: {destination}")
-                    self.handle.file_priority(file_index, 1)
+                    self.set_file_priority(file_index, 1)
 
                     # If the torrent is already finished, data is already at the default path.
                     # Try to deliver it immediately.
                     status = self.handle.status()
                     if status.state in (4, 5):  # 4=finished, 5=seeding
-                        if self._try_deliver_completed_file(file_index, destination, event):
+                        if self._try_deliver_completed_file(file_index, destination, filename):
                             logger.info(f"[{self.repo_id}] Torrent already complete, file {filename} delivered immediately.")
                         else:
                             logger.info(f"[{self.repo_id}] Torrent complete but file {filename} is not yet ready on disk. Monitor will handle.")
@@ -404,11 +594,10 @@ class SessionContext:
         deadline = time.time() + self.timeout if self.timeout > 0 else float('inf')
         
         # Use huggingface_hub's tqdm to integrate with native HF progress bars
-        try:
-            from huggingface_hub.utils import tqdm as hf_tqdm_lib, are_progress_bars_disabled
-            disable_pbar = are_progress_bars_disabled()
-            hf_tqdm = tqdm_class or hf_tqdm_lib
-        except ImportError:
+        if _hf_utils is not None:
+            disable_pbar = _hf_utils.are_progress_bars_disabled()
+            hf_tqdm = tqdm_class or _hf_utils.tqdm
+        else:
             # Fallback if huggingface_hub is not available (shouldn't happen in our context)
             hf_tqdm = tqdm_class
             disable_pbar = True
@@ -419,20 +608,22 @@ class SessionContext:
         file_index = None
 
         try:
-            while not event.is_set():
+            while not self._is_file_completed(filename):
                 if not self.is_valid:
                     logger.warning(f"[{self.repo_id}] P2P download of {filename} ABORTED (monitor stopped).")
                     return False
                 remaining = deadline - time.time()
                 if remaining <= 0:
                     break
-                event.wait(timeout=min(1.0, remaining))
-                
+                with self.completion_cond:
+                    if filename not in self.completed_files:
+                        self.completion_cond.wait(timeout=min(1.0, remaining))
+
                 # Fetch metadata and file properties dynamically if they arrive
                 if file_index is None and self.torrent_info_obj:
                     file_index = self._find_file_index(filename)
                     if file_index is not None:
-                        total_size = self.torrent_info_obj.files().file_size(file_index)
+                        total_size = self._get_file_size(file_index)
                 
                 # If we have a valid index and handle, we can update the progress bar
                 if file_index is not None and self.handle and self.handle.is_valid():
@@ -475,27 +666,32 @@ class SessionContext:
 
         finally:
             if pbar is not None:
-                if event.is_set() and last_progress < total_size:
+                if self._is_file_completed(filename) and last_progress < total_size:
                     pbar.update(total_size - last_progress)
                 if hasattr(pbar, 'close'):
                     pbar.close()
 
-        if event.is_set():
+        if self._is_file_completed(filename):
             logger.info(f"[{self.repo_id}] P2P download of {filename} SUCCESS.")
             return True
 
         # Boundary race: the monitor may finish delivery just as the caller's
         # timeout expires. Confirm once locally before falling back to HTTP.
-        if file_index is not None and self._try_deliver_completed_file(file_index, destination, event):
+        if file_index is not None and self._try_deliver_completed_file(file_index, destination, filename):
             logger.info(f"[{self.repo_id}] P2P download of {filename} SUCCESS after timeout boundary reconciliation.")
             return True
 
         grace = _TIMEOUT_DELIVERY_GRACE_SECONDS if self.timeout >= 30 else 0.0
-        if grace > 0 and event.wait(timeout=grace):
-            logger.info(f"[{self.repo_id}] P2P download of {filename} SUCCESS during timeout grace window.")
-            return True
+        if grace > 0:
+            with self.completion_cond:
+                completed = self.completion_cond.wait_for(
+                    lambda: filename in self.completed_files, timeout=grace
+                )
+            if completed:
+                logger.info(f"[{self.repo_id}] P2P download of {filename} SUCCESS during timeout grace window.")
+                return True
 
-        if file_index is not None and self._try_deliver_completed_file(file_index, destination, event):
+        if file_index is not None and self._try_deliver_completed_file(file_index, destination, filename):
             logger.info(f"[{self.repo_id}] P2P download of {filename} SUCCESS after timeout grace reconciliation.")
             return True
 
@@ -634,27 +830,44 @@ class SessionContext:
         lt_path = self.torrent_info_obj.files().file_path(file_index)
         return os.path.join(self.temp_dir, lt_path)
 
+    def _build_file_index_map(self) -> Dict[str, int]:
+        """Build the filename -> file index map from torrent metadata.
+
+        Each ``files.file_path(i)`` call is a round trip into libtorrent, so
+        the file list is walked exactly once and every later lookup (including
+        the monitor's per-tick pending-file scan) is a dict hit.  Both the raw
+        normalized path and the root-stripped path are registered, matching
+        the two lookup cases the linear scan used to cover.  The same pass
+        fills the per-index size cache consumed by :meth:`_get_file_size`.
+        """
+        index_map: Dict[str, int] = {}
+        sizes: List[int] = []
+        files = self.torrent_info_obj.files()
+        for i in range(files.num_files()):
+            lt_path = files.file_path(i)
+            # Exact match (fallback for third-party single-file torrents)
+            index_map.setdefault(lt_path.replace('\\', '/'), i)
+            # Multi-file torrent (standard for our client, strips root folder)
+            index_map.setdefault(strip_torrent_root(lt_path), i)
+            sizes.append(files.file_size(i))
+        self._file_sizes = sizes
+        return index_map
+
+    def _get_file_size(self, file_index: int) -> int:
+        """Return a file's size from the cached size vector when possible."""
+        if 0 <= file_index < len(self._file_sizes):
+            return self._file_sizes[file_index]
+        return self.torrent_info_obj.files().file_size(file_index)
+
     def _find_file_index(self, target_filename: str) -> Optional[int]:
         """Find the libtorrent file index matching the requested filename."""
         if not self.torrent_info_obj:
             return None
-            
-        files = self.torrent_info_obj.files()
-        target_norm = target_filename.replace('\\', '/')
-        
-        for i in range(files.num_files()):
-            lt_path = files.file_path(i)
-            lt_norm = lt_path.replace('\\', '/')
-            
-            # Case 1: Exact match (fallback for third-party single-file torrents)
-            if lt_norm == target_norm:
-                return i
-                
-            # Case 2: Multi-file torrent (standard for our client, strips root folder)
-            if strip_torrent_root(lt_path) == target_norm:
-                return i
-                
-        return None
+
+        if self._index_by_filename is None:
+            self._index_by_filename = self._build_file_index_map()
+
+        return self._index_by_filename.get(target_filename.replace('\\', '/'))
 
     def _get_webseed_url(self) -> Optional[str]:
         """Build the WebSeed URL for this session's repo, if the proxy is running.
@@ -742,22 +955,42 @@ class SessionContext:
                     f"{mapped_count}/{required_count} required files."
                 )
                 return False
+
+            # seed_mode cannot be flipped on a running torrent (it is an
+            # add_torrent_params-only flag; set_flags() silently ignores it),
+            # so the renamed files must be rechecked before libtorrent will
+            # serve them.  Trigger the recheck and return — it runs on
+            # libtorrent's disk threads, and seeding starts as pieces verify,
+            # without the old blocking wait loop.
+            self.handle.resume()
+            self.handle.force_recheck()
             self.full_mapping = True
+            logger.info(f"[{self.repo_id}] [legacy] Recheck started in background; seeding begins as pieces verify.")
             return True
 
+    def _mark_file_completed(self, filename: str) -> None:
+        """Record *filename* as delivered and wake all threads waiting on it."""
+        with self.completion_cond:
+            self.completed_files.add(filename)
+            self.completion_cond.notify_all()
+
+    def _is_file_completed(self, filename: str) -> bool:
+        """Return True once *filename* has been delivered to its destination."""
+        with self.completion_cond:
+            return filename in self.completed_files
+
     def _try_deliver_completed_file(
         self,
         file_index: int,
         destination: str,
-        event: Optional[threading.Event] = None,
+        filename: Optional[str] = None,
     ) -> bool:
         """Deliver a file immediately if libtorrent has already hash-verified it."""
         if file_index is None or not self.handle or not self.torrent_info_obj:
             return False
 
         try:
-            files = self.torrent_info_obj.files()
-            file_size = files.file_size(file_index)
+            file_size = self._get_file_size(file_index)
             if file_size <= 0:
                 return False
 
@@ -770,8 +1003,8 @@ class SessionContext:
                 return False
 
             self._deliver_file(src, destination)
-            if event is not None:
-                event.set()
+            if filename is not None:
+                self._mark_file_completed(filename)
             return True
         except Exception:
             return False
@@ -784,28 +1017,46 @@ class SessionContext:
 
     def _deliver_file(self, src: str, dst: str):
         """Copy a completed file from libtorrent's download path to the HF destination.
-        
+
         Uses os.link() (hard link) for zero-copy on the same filesystem,
-        falls back to shutil.copy2() for cross-device.
-        
-        The source files in p2p_root MUST be preserved while the torrent is active 
+        falls back to a sendfile-based kernel copy for cross-device.  Either
+        way the file is staged under a temporary sibling name and moved into
+        place with os.replace(), so a crash mid-delivery never leaves a
+        partially-written file at *dst* and a stale *dst* is swapped out
+        atomically instead of being unlinked first.
+
+        The source files in p2p_root MUST be preserved while the torrent is active
         so libtorrent can read pieces/chunks across file boundaries. The entire
         session's temporary directory is cleaned up upon session teardown.
         """
-        os.makedirs(os.path.dirname(dst), exist_ok=True)
-        
-        # Remove destination if it already exists (e.g., stale .incomplete file)
-        if os.path.exists(dst):
-            os.unlink(dst)
+        self._ensure_dir(os.path.dirname(dst))
 
+        tmp = f"{dst}.llmpt-{os.getpid()}.tmp"
         try:
-            # Hard link: instant, no extra disk space on same filesystem
-            os.link(src, dst)
-            logger.debug(f"[{self.repo_id}] Hard-linked {src} -> {dst}")
-        except OSError:
-            # Cross-device fallback
-            shutil.copy2(src, dst)
-            logger.debug(f"[{self.repo_id}] Copied {src} -> {dst}")
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            try:
+                # Hard link: instant, no extra disk space on same filesystem
+                os.link(src, tmp)
+                logger.debug(f"[{self.repo_id}] Hard-linked {src} -> {dst}")
+            except OSError:
+                # Cross-device fallback: kernel copy, no full-file Python buffer
+                _kernel_copy_file(src, tmp)
+                logger.debug(f"[{self.repo_id}] Copied {src} -> {dst}")
+            os.replace(tmp, dst)
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def _ensure_dir(self, directory: str) -> None:
+        """Create *directory* once per session, skipping repeat syscalls."""
+        if directory not in self._ensured_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
 
     def cleanup_temp_dir(self):
         """Delete this torrent's subdirectory within p2p_root.
@@ -3,8 +3,10 @@ Torrent creation utilities.
 """
 
 import logging
+import platform
 import re
 import os
+import stat
 from pathlib import Path
 from typing import Optional, Any
 
@@ -13,6 +15,50 @@ from .utils import lt, LIBTORRENT_AVAILABLE, get_optimal_piece_length, format_by
 logger = logging.getLogger('llmpt.torrent_creator')
 _COMMIT_HASH_RE = re.compile(r"^[0-9a-f]{40}$")
 
+_hashing_backend_logged = False
+
+
+def _log_hashing_backend() -> None:
+    """Log the crypto backend behind piece hashing, once per process.
+
+    ``set_piece_hashes`` is compute-bound on SHA inside libtorrent's crypto
+    library; on x86-64 the linked OpenSSL dispatches to the SHA hardware
+    instructions when the CPU has them.  The Python binding exposes no way to
+    raise ``hashing_threads``, so surfacing the backend (and warning when SHA
+    extensions are missing) at least makes slow hashing runs explainable.
+    """
+    global _hashing_backend_logged
+    if _hashing_backend_logged:
+        return
+    _hashing_backend_logged = True
+
+    try:
+        import ssl
+        logger.debug(f"Piece hashing crypto backend: {ssl.OPENSSL_VERSION}")
+    except Exception:
+        return
+
+    machine = platform.machine()
+    if machine in ('x86_64', 'AMD64'):
+        # SHA-NI flag on x86-64.
+        missing_flag = ' sha_ni'
+    elif machine == 'aarch64':
+        # ARMv8 Crypto Extensions flag (sha2 covers the sha256h family).
+        missing_flag = ' sha2'
+    else:
+        # Apple Silicon (arm64/macOS) always has the crypto extensions and
+        # exposes no /proc/cpuinfo; other architectures we do not probe.
+        return
+    try:
+        with open('/proc/cpuinfo') as cpuinfo:
+            if missing_flag not in cpuinfo.read():
+                logger.warning(
+                    "CPU does not advertise SHA extensions; piece hashing for "
+                    "large repos will be slower than usual"
+                )
+    except OSError:
+        pass
+
 
 def _mark_tracker_registration_safe(
     repo_id: str,
@@ -132,12 +178,18 @@ def _build_local_dir_file_storage(
 
     for relative_path in manifest:
         file_path = source_root / relative_path
-        if not file_path.exists() or not file_path.is_file():
+        # One stat per file: exists()/is_file() each stat again, which adds
+        # up over NFS/FUSE-backed storage with large manifests.
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             logger.error(
                 f"[{repo_id}] Verified local_dir file missing while building torrent: {relative_path}"
             )
             return None, None
-        fs.add_file(f"{torrent_root}/{relative_path}", file_path.stat().st_size)
+        fs.add_file(f"{torrent_root}/{relative_path}", file_stat.st_size)
 
     return fs, str(source_root.parent)
 
@@ -184,12 +236,16 @@ def _expected_completed_files(
         base_dir = Path(local_dir)
         for relative_path in manifest:
             file_path = base_dir / relative_path
-            if not file_path.exists() or not file_path.is_file():
+            try:
+                file_stat = file_path.stat()
+            except OSError:
+                file_stat = None
+            if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
                 logger.warning(
                     f"[{repo_id}] Completed local_dir manifest no longer resolves: {relative_path}"
                 )
                 return []
-            files.append({"path": relative_path, "size": file_path.stat().st_size})
+            files.append({"path": relative_path, "size": file_stat.st_size})
     else:
         from huggingface_hub import try_to_load_from_cache
 
@@ -202,12 +258,16 @@ def _expected_completed_files(
                 repo_type=lookup_repo_type,
                 cache_dir=cache_dir,
             )
-            if not resolved or not os.path.exists(resolved):
+            try:
+                resolved_size = os.path.getsize(resolved) if resolved else None
+            except OSError:
+                resolved_size = None
+            if resolved_size is None:
                 logger.warning(
                     f"[{repo_id}] Completed cache manifest no longer resolves: {relative_path}"
                 )
                 return []
-            files.append({"path": relative_path, "size": os.path.getsize(resolved)})
+            files.append({"path": relative_path, "size": resolved_size})
 
     files.sort(key=lambda item: item["path"])
     return files
@@ -472,9 +532,20 @@ def create_torrent(
         comment_target = commit_hash if _COMMIT_HASH_RE.match(commit_hash or "") else file_path.name
         t.set_comment(f"Created by llmpt for {comment_target}")
 
-        # Generate piece hashes
+        # Generate piece hashes.  This is the expensive step (sequential read
+        # + SHA over the whole snapshot), so log coarse progress while it runs.
+        _log_hashing_backend()
         logger.info(f"Generating piece hashes for {file_path.name}...")
-        lt.set_piece_hashes(t, piece_hash_base)
+        expected_pieces = max(1, (total_size + piece_length - 1) // piece_length)
+        progress_step = max(1, expected_pieces // 10)
+
+        def _on_piece_hashed(piece_index):
+            if (piece_index + 1) % progress_step == 0 or piece_index + 1 == expected_pieces:
+                logger.debug(
+                    f"[{repo_id}] Hashed {piece_index + 1}/{expected_pieces} pieces"
+                )
+
+        lt.set_piece_hashes(t, piece_hash_base, _on_piece_hashed)
 
         # Generate torrent
         torrent = t.generate()
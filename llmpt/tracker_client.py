@@ -3,6 +3,8 @@ Tracker client for communicating with the llmpt tracker server.
 """
 
 import logging
+import re
+import threading
 import requests
 from typing import Optional, Dict, Any, List
 from urllib.parse import urljoin
@@ -11,6 +13,33 @@ from .transfer_types import LogicalTorrentRef, SourceFileCandidate, TorrentSourc
 
 logger = logging.getLogger(__name__)
 
+_COMMIT_HASH_RE = re.compile(r'^[0-9a-f]{40}$')
+
+# In-memory cache: (tracker_url, repo_type, repo_id, revision) → torrent dict.
+# Only fully-resolved commit-hash revisions are cached — those tracker entries
+# are immutable — so concurrent snapshot shards share one lookup instead of
+# issuing one tracker round-trip per file.  Negative results are never cached
+# because a torrent may be registered at any moment.
+_torrent_info_cache: dict = {}
+_torrent_info_cache_lock = threading.Lock()
+
+# Prefetched file-source candidates from one batched tracker query:
+# (tracker_url, repo_type, repo_id, revision, filename) → parsed candidates.
+# snapshot_download seeds this cache up front via prefetch_file_sources so
+# per-file transfer planning does not issue one /file-sources round-trip per
+# file.  Module-level (not thread-local) because snapshot_download fans the
+# actual downloads out to worker threads.
+_file_sources_cache: dict = {}
+_file_sources_cache_lock = threading.Lock()
+
+
+def clear_torrent_info_cache() -> None:
+    """Drop all cached tracker lookup results (used on disable_p2p)."""
+    with _torrent_info_cache_lock:
+        _torrent_info_cache.clear()
+    with _file_sources_cache_lock:
+        _file_sources_cache.clear()
+
 
 class TrackerClient:
     """Client for interacting with llmpt tracker server."""
@@ -25,7 +54,38 @@ class TrackerClient:
         """
         self.tracker_url = tracker_url.rstrip('/')
         self.timeout = timeout
+        # One pooled session per client: every API call hits the same tracker
+        # host, so keep-alive connections avoid a TCP(+TLS) handshake per
+        # request.  Transient 5xx responses are retried with a short backoff.
         self.session = requests.Session()
+        # pool_maxsize must cover snapshot_download's worker fan-out, or the
+        # overflow requests open throwaway sockets that never re-enter the pool.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=requests.adapters.Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=None,  # retry POSTs too; publish is idempotent
+            ),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Endpoints are fixed per client; resolve them once instead of
+        # re-running urljoin's parse/normalize on every call.
+        self._torrents_url = urljoin(self.tracker_url, '/api/v1/torrents')
+        self._file_sources_url = urljoin(self.tracker_url, '/api/v1/file-sources')
+        self._file_sources_batch_url = urljoin(self.tracker_url, '/api/v1/file-sources/batch')
+        self._torrent_file_url = urljoin(self.tracker_url, '/api/v1/torrents/torrent')
+        self._publish_url = urljoin(self.tracker_url, '/api/v1/publish')
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by this client."""
+        try:
+            self.session.close()
+        except Exception:
+            pass
 
     def get_torrent_info(
         self,
@@ -45,8 +105,17 @@ class TrackerClient:
             Dictionary containing torrent info (info_hash, total_size, files, etc.)
             or None if torrent doesn't exist.
         """
+        cache_key = None
+        if revision and _COMMIT_HASH_RE.match(revision):
+            cache_key = (self.tracker_url, repo_type, repo_id, revision)
+            with _torrent_info_cache_lock:
+                cached = _torrent_info_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Torrent info cache hit for {repo_id}@{revision[:8]}")
+                return cached
+
         try:
-            url = urljoin(self.tracker_url, '/api/v1/torrents')
+            url = self._torrents_url
             params = {'repo_id': repo_id, 'repo_type': repo_type}
             if revision:
                 params['revision'] = revision
@@ -76,6 +145,9 @@ class TrackerClient:
             # Server now filters by revision, so the first result is the match
             torrent = torrents[0]
             logger.info(f"Found torrent for {repo_id} (revision: {torrent.get('revision', 'N/A')}): {torrent.get('info_hash', 'N/A')}")
+            if cache_key is not None:
+                with _torrent_info_cache_lock:
+                    _torrent_info_cache[cache_key] = torrent
             return torrent
 
         except requests.RequestException as e:
@@ -97,8 +169,15 @@ class TrackerClient:
         this endpoint yet; in that case we simply return an empty list and let
         the caller fall back to the target torrent itself.
         """
+        cache_key = (self.tracker_url, repo_type, repo_id, revision, filename)
+        with _file_sources_cache_lock:
+            cached = _file_sources_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"File sources cache hit for {repo_id}/{filename}")
+            return list(cached)
+
         try:
-            url = urljoin(self.tracker_url, '/api/v1/file-sources')
+            url = self._file_sources_url
             params = {
                 'repo_id': repo_id,
                 'revision': revision,
@@ -134,6 +213,90 @@ class TrackerClient:
             logger.warning(f"Failed to resolve file sources: {e}")
             return []
 
+    def prefetch_file_sources(
+        self,
+        repo_id: str,
+        revision: str,
+        filenames: List[str],
+        *,
+        repo_type: str = 'model'
+    ) -> bool:
+        """Resolve source candidates for many files in one tracker round-trip.
+
+        Seeds the module-level cache consulted by ``resolve_file_sources`` —
+        every requested filename gets an entry (missing files map to an empty
+        candidate list), so a prefetched snapshot issues zero per-file
+        ``/file-sources`` requests afterwards.
+
+        Returns:
+            True when the batch endpoint answered; False when it is
+            unavailable (older trackers) or the request failed, in which case
+            per-file lookups proceed as before.
+        """
+        filenames = [name for name in filenames if name]
+        if not filenames:
+            return True
+
+        try:
+            url = self._file_sources_batch_url
+            logger.debug(
+                f"Batch-resolving file sources for {len(filenames)} files "
+                f"of {repo_id}@{revision}"
+            )
+            response = self.session.post(
+                url,
+                json={
+                    'repo_id': repo_id,
+                    'revision': revision,
+                    'repo_type': repo_type,
+                    'paths': filenames,
+                },
+                timeout=self.timeout,
+            )
+
+            if response.status_code in (404, 405):
+                logger.debug(
+                    f"Tracker does not expose batched file sources for {repo_id}"
+                )
+                return False
+
+            response.raise_for_status()
+            payload = response.json()
+        except requests.RequestException as e:
+            logger.warning(f"Failed to batch-resolve file sources: {e}")
+            return False
+
+        per_file = self._extract_batch_candidate_map(payload)
+        with _file_sources_cache_lock:
+            for filename in filenames:
+                candidates = []
+                for item in per_file.get(filename, []):
+                    candidate = self._parse_source_file_candidate(item)
+                    if candidate is not None:
+                        candidates.append(candidate)
+                cache_key = (self.tracker_url, repo_type, repo_id, revision, filename)
+                _file_sources_cache[cache_key] = candidates
+        return True
+
+    def _extract_batch_candidate_map(self, payload: Any) -> dict[str, list[dict[str, Any]]]:
+        """Extract the per-filename candidate map from a batch lookup payload."""
+        if not isinstance(payload, dict):
+            return {}
+
+        data = payload.get('data', payload)
+        if isinstance(data, dict):
+            files = data.get('files', data)
+        else:
+            files = {}
+        if not isinstance(files, dict):
+            return {}
+
+        return {
+            name: [item for item in items if isinstance(item, dict)]
+            for name, items in files.items()
+            if isinstance(items, list)
+        }
+
     def _extract_candidate_items(self, payload: Any) -> list[dict[str, Any]]:
         """Extract candidate rows from either flat or wrapped tracker payloads."""
         if isinstance(payload, list):
@@ -216,7 +379,7 @@ class TrackerClient:
             Raw torrent bytes, or None if not found.
         """
         try:
-            url = urljoin(self.tracker_url, '/api/v1/torrents/torrent')
+            url = self._torrent_file_url
 
             response = self.session.get(
                 url,
@@ -273,7 +436,7 @@ class TrackerClient:
         import base64
 
         try:
-            url = urljoin(self.tracker_url, '/api/v1/publish')
+            url = self._publish_url
             data = {
                 'repo_id': repo_id,
                 'revision': revision,
@@ -2,6 +2,7 @@
 Utility functions.
 """
 
+import bisect
 import hashlib
 import logging
 import os
@@ -102,6 +103,13 @@ def resolve_commit_hash(
     return commit_hash
 
 
+_HASH_CONSTRUCTORS = {
+    'sha256': hashlib.sha256,
+    'sha1': hashlib.sha1,
+    'md5': hashlib.md5,
+}
+
+
 def calculate_file_hash(file_path: str, algorithm: str = 'sha256') -> str:
     """
     Calculate hash of a file.
@@ -113,9 +121,25 @@ def calculate_file_hash(file_path: str, algorithm: str = 'sha256') -> str:
     Returns:
         Hex digest of the file hash.
     """
-    hash_obj = hashlib.new(algorithm)
+    # Direct C constructors skip the per-call string lookup hashlib.new()
+    # does; unknown algorithm names still go through hashlib.new.
+    digest = _HASH_CONSTRUCTORS.get(algorithm) or (lambda: hashlib.new(algorithm))
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
+        # Hint the kernel at the sequential full-file read so it widens the
+        # readahead window; matters for multi-GB model files on cold caches.
+        # Not available on Windows / some non-POSIX platforms.
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        # hashlib.file_digest (3.11+) streams through a zero-copy C loop,
+        # avoiding per-chunk Python bytecode overhead; OpenSSL dispatches to
+        # SHA hardware instructions where the CPU has them.
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, digest).hexdigest()
+        hash_obj = digest()
+        while chunk := f.read(1 << 20):
             hash_obj.update(chunk)
     return hash_obj.hexdigest()
 
@@ -152,6 +176,26 @@ def strip_torrent_root(lt_file_path: str) -> str:
     return parts[1] if len(parts) == 2 else normalized
 
 
+# Size thresholds (exclusive upper bounds) and the piece length chosen for
+# each band; _PIECE_LENGTHS has one extra entry for sizes past the last
+# threshold.  Keep in sync with the ladder in the docstring below.
+_PIECE_LENGTH_THRESHOLDS = (
+    100 << 20,   # 100 MB
+    1 << 30,     # 1 GB
+    10 << 30,    # 10 GB
+    100 << 30,   # 100 GB
+    1 << 40,     # 1 TB
+)
+_PIECE_LENGTHS = (
+    256 << 10,   # 256 KB
+    1 << 20,     # 1 MB
+    4 << 20,     # 4 MB
+    16 << 20,    # 16 MB
+    32 << 20,    # 32 MB
+    64 << 20,    # 64 MB
+)
+
+
 def get_optimal_piece_length(total_size: int) -> int:
     """
     Calculate optimal piece length for a torrent based on total content size.
@@ -173,17 +217,4 @@ def get_optimal_piece_length(total_size: int) -> int:
         - 100 GB – 1 TB  → 32 MB  (e.g. Llama-3.1-405B ~800GB)
         - ≥ 1 TB         → 64 MB  (e.g. massive MoE models)
     """
-    GB = 1024 * 1024 * 1024
-
-    if total_size < 100 * 1024 * 1024:  # <100MB
-        return 256 * 1024  # 256KB
-    elif total_size < 1 * GB:  # <1GB
-        return 1024 * 1024  # 1MB
-    elif total_size < 10 * GB:  # <10GB
-        return 4 * 1024 * 1024  # 4MB
-    elif total_size < 100 * GB:  # <100GB
-        return 16 * 1024 * 1024  # 16MB
-    elif total_size < 1024 * GB:  # <1TB
-        return 32 * 1024 * 1024  # 32MB
-    else:  # ≥1TB
-        return 64 * 1024 * 1024  # 64MB
+    return _PIECE_LENGTHS[bisect.bisect_right(_PIECE_LENGTH_THRESHOLDS, total_size)]
@@ -71,11 +71,27 @@ EXPECTED_SINGLE_FILE_OUTPUTS = {
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
+def _wait_for_tracker(tracker_url, timeout=60):
+    """Poll until the tracker answers, instead of sleeping a fixed warm-up."""
+    api_url = f"{tracker_url.rstrip('/')}/api/v1/torrents"
+    deadline = time.time() + timeout
+    interval = 0.25
+    while time.time() < deadline:
+        try:
+            requests.get(api_url, timeout=5)
+            return True
+        except Exception:
+            time.sleep(interval)
+            interval = min(interval * 1.5, 5.0)
+    return False
+
+
 def _wait_for_torrent_on_tracker(tracker_url, repo_id, timeout=180):
     """Poll the tracker until a torrent for repo_id appears."""
     api_url = f"{tracker_url.rstrip('/')}/api/v1/torrents"
     deadline = time.time() + timeout
     attempt = 0
+    interval = 0.25
     while time.time() < deadline:
         attempt += 1
         try:
@@ -93,7 +109,8 @@ def _wait_for_torrent_on_tracker(tracker_url, repo_id, timeout=180):
                         return True
         except Exception as e:
             print(f"[Test] Tracker poll #{attempt} failed: {e}", flush=True)
-        time.sleep(5)
+        time.sleep(interval)
+        interval = min(interval * 1.5, 5.0)
     return False
 
 
@@ -315,7 +332,7 @@ def _bootstrap_with_running_daemon(
     from llmpt.ipc import query_daemon
     from llmpt.utils import resolve_commit_hash
 
-    time.sleep(10)
+    _wait_for_tracker(tracker_url)
     _prepare_signal_files(ready_signal, done_signal)
     _delete_stale_torrents(tracker_url, repo_id)
     cleanup_paths = [snapshot_kwargs.get("cache_dir"), snapshot_kwargs.get("local_dir")]
@@ -398,7 +415,7 @@ def _download_via_p2p_with_custom_storage(
     snapshot_kwargs,
     label,
 ):
-    time.sleep(15)
+    _wait_for_tracker(tracker_url)
     cleanup_path = snapshot_kwargs.get("cache_dir") or snapshot_kwargs.get("local_dir")
     if cleanup_path:
         _clear_path(cleanup_path)
@@ -448,7 +465,7 @@ def _download_single_files_via_p2p(
     expected_payload_files,
     label,
 ):
-    time.sleep(15)
+    _wait_for_tracker(tracker_url)
     _clear_path(local_dir)
 
     llmpt.enable_p2p(tracker_url=tracker_url, timeout=60, webseed=False)
@@ -550,9 +567,8 @@ def test_daemon_cold_start_bootstrap():
       - enable_p2p() creates a libtorrent session that competes for port 6881
       - We only need the daemon for seeding, not the download-side patches
     """
-    time.sleep(10)
-
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
+    _wait_for_tracker(tracker_url)
 
     # ── 0. Delete any stale torrent from previous test runs ──
     # Previous E2E tests may have registered torrents with different piece hashes.
@@ -675,9 +691,8 @@ def test_daemon_p2p_download_after_bootstrap():
     This test runs on a separate container that has the seeder's torrent
     available on the tracker.
     """
-    time.sleep(15)
-
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
+    _wait_for_tracker(tracker_url)
     llmpt.enable_p2p(tracker_url=tracker_url, timeout=60, webseed=False)
 
     reset_download_stats()
@@ -732,9 +747,8 @@ def test_daemon_dataset_bootstrap():
       3. Daemon creates torrent and registers it on tracker
       4. Keep seeding so the second-user can download via P2P
     """
-    time.sleep(10)
-
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
+    _wait_for_tracker(tracker_url)
 
     # ── 0. Delete any stale torrent from previous test runs ──
     api_url = f"{tracker_url.rstrip('/')}/api/v1/torrents"
@@ -790,8 +804,7 @@ def test_daemon_dataset_bootstrap():
     from llmpt.ipc import query_daemon as _query_daemon
     scan_result = _query_daemon("scan")
     print(f"[Test] Triggered daemon rescan: {scan_result}", flush=True)
-    # Give the daemon a moment to process the scan
-    time.sleep(5)
+    # No fixed wait: the registration poll below observes the scan's outcome.
 
     # ── 3. Wait for daemon to create and register the torrent ──
     print("[Test] Waiting for daemon to create torrent and register...", flush=True)
@@ -838,9 +851,8 @@ def test_daemon_p2p_dataset_download_after_bootstrap():
     After the cold-start bootstrap (test above), verify that the SECOND
     downloader can use P2P to download the dataset.
     """
-    time.sleep(15)
-
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
+    _wait_for_tracker(tracker_url)
     llmpt.enable_p2p(tracker_url=tracker_url, timeout=60, webseed=False)
 
     reset_download_stats()
@@ -63,6 +63,9 @@ def _wait_for_seeder_ready(tracker_url: str, repo_id: str, timeout: int = 180) -
     api_url = f"{tracker_url.rstrip('/')}/api/v1/torrents"
     deadline = time.time() + timeout
     attempt = 0
+    # Exponential backoff: react within a fraction of a second once the
+    # torrent appears, without hammering the tracker while it boots.
+    interval = 0.25
     while time.time() < deadline:
         attempt += 1
         try:
@@ -81,7 +84,8 @@ def _wait_for_seeder_ready(tracker_url: str, repo_id: str, timeout: int = 180) -
                         return True
         except Exception as e:
             print(f"[Downloader] Tracker poll #{attempt} failed: {e}", flush=True)
-        time.sleep(5)
+        time.sleep(interval)
+        interval = min(interval * 1.5, 5.0)
 
     print(f"[Downloader] Seeder did NOT register within {timeout}s.", flush=True)
     return False
@@ -161,9 +165,8 @@ def test_true_p2p_download():
     If WebSeed were on, it would act as an invisible fallback and mask
     P2P connectivity issues.
     """
-    # Give containers a moment to fully start up before polling
-    time.sleep(15)
-
+    # No warm-up sleep needed: _wait_for_seeder_ready tolerates the tracker
+    # not being reachable yet and backs off while containers start.
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
     llmpt.enable_p2p(tracker_url=tracker_url, timeout=120, webseed=False)
 
@@ -212,9 +215,8 @@ def test_dataset_p2p_download():
     Downloads the dataset that the Seeder container is currently hosting.
     Asserts that every single file goes through P2P — no HTTP fallbacks.
     """
-    # Give containers a moment to fully start up before polling
-    time.sleep(15)
-
+    # No warm-up sleep needed: _wait_for_seeder_ready tolerates the tracker
+    # not being reachable yet and backs off while containers start.
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
     llmpt.enable_p2p(tracker_url=tracker_url, timeout=120, webseed=False)
 
@@ -276,9 +278,8 @@ def test_webseed_only_download():
     NOTE: This test should be run WITHOUT a TEST_SEEDER_PEER env var,
     so the downloader has no P2P peers and relies entirely on WebSeed.
     """
-    # Give containers a moment to fully start up before polling
-    time.sleep(15)
-
+    # No warm-up sleep needed: _wait_for_seeder_ready tolerates the tracker
+    # not being reachable yet and backs off while containers start.
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
     llmpt.enable_p2p(tracker_url=tracker_url, timeout=120, webseed=True)
 
@@ -373,9 +374,8 @@ def test_webseed_with_p2p_download():
     2. All files are downloaded successfully
     3. The download completes without HTTP fallback
     """
-    # Give containers a moment to fully start up before polling
-    time.sleep(15)
-
+    # No warm-up sleep needed: _wait_for_seeder_ready tolerates the tracker
+    # not being reachable yet and backs off while containers start.
     tracker_url = os.environ.get("TRACKER_URL", "http://118.195.159.242")
     llmpt.enable_p2p(tracker_url=tracker_url, timeout=120, webseed=True)
 
@@ -118,7 +118,7 @@ def make_mock_ctx(repo_id: str = "test/repo", **overrides) -> MagicMock:
     ctx.lock = threading.Lock()
     ctx.alert_lock = threading.Lock()
     ctx.pending_alerts = deque()
-    ctx.file_events = {}
+    ctx.completed_files = set()
     ctx.file_destinations = {}
     ctx.torrent_info_obj = None
     ctx.fastresume_path = f"/tmp/{repo_id.replace('/', '_')}.fastresume"
@@ -72,6 +72,36 @@ class TestDispatchAlerts:
         assert len(ctx_b.pending_alerts) == 1
         assert ctx_b.pending_alerts[0] == ResumeDataReadyEvent(b'bbb')
 
+    def test_file_completed_alert_routed_and_wakes_monitor(self):
+        """file_completed_alert should land in the inbox and wake the monitor."""
+        from llmpt.alert_events import AlertLogEvent
+        from llmpt.p2p_batch import P2PBatchManager
+
+        handle = MagicMock(name="handle")
+        ctx = make_mock_ctx(repo_id="owner/repo")
+        ctx.handle = handle
+
+        FileCompletedAlert = type('file_completed_alert', (), {})
+        alert = MagicMock()
+        alert.__class__ = FileCompletedAlert
+        alert.handle = handle
+        alert.message.return_value = "file 3 complete"
+
+        manager = P2PBatchManager.__new__(P2PBatchManager)
+        manager._initialized = True
+        manager.lt_session = MagicMock()
+        manager.lt_session.pop_alerts.return_value = [alert]
+        manager.sessions = {("owner/repo", "main"): ctx}
+
+        with patch('llmpt.p2p_batch.lt') as mock_lt:
+            mock_lt.file_completed_alert = FileCompletedAlert
+            manager.dispatch_alerts()
+
+        assert len(ctx.pending_alerts) == 1
+        assert isinstance(ctx.pending_alerts[0], AlertLogEvent)
+        assert ctx.pending_alerts[0].prefix == "FILE COMPLETED"
+        ctx.monitor_wakeup.set.assert_called_once()
+
     def test_alerts_not_stolen_across_sessions(self):
         """
         Regression test for the original bug: session A must NOT steal session B's
@@ -236,3 +266,48 @@ class TestDispatchAlerts:
         # Should not raise
         with patch('llmpt.p2p_batch.lt') as mock_lt:
             manager.dispatch_alerts()
+
+
+class TestStateUpdateAlertCaching:
+    """Bulk status refreshes should be cached on contexts, not queued as events."""
+
+    def test_state_update_alert_caches_status_snapshot(self):
+        from llmpt.p2p_batch import P2PBatchManager
+
+        handle = MagicMock(name="handle")
+        ctx = make_mock_ctx(repo_id="owner/repo")
+        ctx.handle = handle
+        ctx.last_status = None
+
+        StateUpdateAlert = type('state_update_alert', (), {})
+        torrent_status = MagicMock()
+        torrent_status.handle = handle
+        torrent_status.total_upload = 123
+        torrent_status.num_peers = 4
+        torrent_status.upload_rate = 99
+        torrent_status.progress = 0.5
+        torrent_status.state = 'seeding'
+
+        alert = MagicMock(spec=['status'])
+        alert.__class__ = StateUpdateAlert
+        alert.status = [torrent_status]
+
+        manager = P2PBatchManager.__new__(P2PBatchManager)
+        manager._initialized = True
+        manager.lt_session = MagicMock()
+        manager.lt_session.pop_alerts.return_value = [alert]
+        manager.sessions = {("owner/repo", "main"): ctx}
+
+        with patch('llmpt.p2p_batch.lt') as mock_lt:
+            mock_lt.state_update_alert = StateUpdateAlert
+            manager.dispatch_alerts()
+
+        assert ctx.last_status == {
+            'uploaded': 123,
+            'peers': 4,
+            'upload_rate': 99,
+            'progress': 0.5,
+            'state': 'seeding',
+        }
+        # The refresh is a cache write, not a routed alert event.
+        assert len(ctx.pending_alerts) == 0
@@ -291,7 +291,7 @@ def test_checkpoint_wakes_alert_pump_instead_of_dispatch(mock_lt_all_modules):
 
     with patch.object(manager, '_request_alert_pump_wakeup') as mock_wakeup, \
          patch.object(manager, 'dispatch_alerts') as mock_dispatch, \
-         patch('llmpt.monitor._process_alerts') as mock_process_alerts, \
+         patch('llmpt.p2p_batch._process_alerts') as mock_process_alerts, \
          patch('os.path.exists', return_value=True), \
          patch('os.stat', side_effect=[stat_a, stat_b]):
         manager._checkpoint_on_demand_session(ctx)
@@ -142,6 +142,15 @@ class TestSaveResumeData:
         ctx.handle = None
         _save_resume_data(ctx)  # Should not raise
 
+    @patch('llmpt.monitor.lt')
+    def test_skips_save_when_nothing_changed(self, mock_lt):
+        """Idle sessions should not flush identical resume data to disk."""
+        ctx = make_mock_ctx()
+        ctx.handle.is_valid.return_value = True
+        ctx.handle.need_save_resume_data.return_value = False
+        _save_resume_data(ctx)
+        ctx.handle.save_resume_data.assert_not_called()
+
 
 # ─── _process_alerts ──────────────────────────────────────────────────────────
 
@@ -227,17 +236,15 @@ class TestCheckPendingFiles:
         status = MagicMock(spec=['state'])
         status.state = 3
         ctx.handle.status.return_value = status
-        ctx.file_events = {}  # Nothing pending
+        ctx.file_destinations = {}  # Nothing pending
 
         assert _check_pending_files(ctx) is False
 
     @patch('llmpt.monitor.lt')
     def test_file_completed_and_delivered(self, mock_lt):
-        """When file progress == file_size, deliver and set event."""
+        """When file progress == file_size, deliver and mark completed."""
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
         ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         # No error in status
@@ -247,7 +254,6 @@ class TestCheckPendingFiles:
 
         # Torrent info setup
         mock_files = MagicMock()
-        mock_files.file_size.return_value = 1000
         mock_files.file_path.return_value = "root/model.bin"
         mock_files.num_files.return_value = 1
 
@@ -258,6 +264,7 @@ class TestCheckPendingFiles:
 
         # _find_file_index returns 0
         ctx._find_file_index.return_value = 0
+        ctx._get_file_size.return_value = 1000
 
         # File is 100% done
         ctx.get_file_progress.return_value = [1000]
@@ -270,7 +277,7 @@ class TestCheckPendingFiles:
         result = _check_pending_files(ctx)
 
         assert result is False
-        assert event.is_set()
+        ctx._mark_file_completed.assert_called_once_with("model.bin")
         ctx._deliver_file.assert_called_once_with("/tmp/p2p/root/model.bin", "/dest/model.bin")
         ctx.get_file_progress.assert_called_once_with(verified_only=True)
 
@@ -279,8 +286,6 @@ class TestCheckPendingFiles:
         """File with partial progress should not trigger delivery."""
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
         ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         status = MagicMock(spec=['state'])
@@ -288,7 +293,6 @@ class TestCheckPendingFiles:
         ctx.handle.status.return_value = status
 
         mock_files = MagicMock()
-        mock_files.file_size.return_value = 1000
         mock_files.num_files.return_value = 1
 
         mock_ti = MagicMock()
@@ -296,13 +300,14 @@ class TestCheckPendingFiles:
         ctx.torrent_info_obj = mock_ti
 
         ctx._find_file_index.return_value = 0
+        ctx._get_file_size.return_value = 1000
         ctx.get_file_progress.return_value = [500]  # Only 50%
         ctx.handle.file_priorities.return_value = [1]
 
         result = _check_pending_files(ctx)
 
         assert result is False
-        assert not event.is_set()
+        ctx._mark_file_completed.assert_not_called()
         ctx._deliver_file.assert_not_called()
         ctx.get_file_progress.assert_called_once_with(verified_only=True)
 
@@ -311,8 +316,7 @@ class TestCheckPendingFiles:
         """During recheck (state 1 or 7), progress checks should be skipped."""
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
+        ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         status = MagicMock(spec=['state', 'has_metadata'])
         status.state = 1  # checking_files
@@ -327,8 +331,7 @@ class TestCheckPendingFiles:
         """When torrent_info_obj is None but metadata becomes available, it should be populated."""
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
+        ctx.file_destinations = {"model.bin": "/dest/model.bin"}
         ctx.torrent_info_obj = None  # metadata not loaded yet
 
         # First call: no error, has_metadata → True
@@ -389,7 +392,7 @@ class TestCheckSessionHealth:
         status = MagicMock(spec=['state'])
         status.state = 3
         ctx.handle.status.return_value = status
-        ctx.file_events = {}
+        ctx.file_destinations = {}
 
         assert _check_session_health(ctx) is False
 
@@ -399,8 +402,7 @@ class TestCheckSessionHealth:
         status.state = 3
         ctx.handle.status.return_value = status
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
+        ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         assert _check_session_health(ctx) is None
 
@@ -450,20 +452,18 @@ class TestCollectReadyFiles:
     def test_collects_completed_files(self):
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
         ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         mock_files = MagicMock()
-        mock_files.file_size.return_value = 1000
 
         mock_ti = MagicMock()
         mock_ti.files.return_value = mock_files
         ctx.torrent_info_obj = mock_ti
 
         ctx._find_file_index.return_value = 0
+        ctx._get_file_size.return_value = 1000
         ctx.get_file_progress.return_value = [1000]
-        ctx.handle.file_priority.return_value = 1
+        ctx.get_file_priority.return_value = 1
         ctx._get_lt_disk_path.return_value = "/tmp/p2p/model.bin"
 
         result = _collect_ready_files(ctx)
@@ -471,64 +471,54 @@ class TestCollectReadyFiles:
         assert len(result) == 1
         assert result[0] == ("/tmp/p2p/model.bin", "/dest/model.bin", "model.bin")
         ctx.get_file_progress.assert_called_once_with(verified_only=True)
-        ctx.handle.file_priority.assert_called_once_with(0)
-        ctx.handle.file_priorities.assert_not_called()
+        ctx.get_file_priority.assert_called_once_with(0)
+        ctx.set_file_priority.assert_not_called()
+        ctx.handle.file_priority.assert_not_called()
 
     def test_skips_incomplete_files(self):
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
         ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         mock_files = MagicMock()
-        mock_files.file_size.return_value = 1000
 
         mock_ti = MagicMock()
         mock_ti.files.return_value = mock_files
         ctx.torrent_info_obj = mock_ti
 
         ctx._find_file_index.return_value = 0
+        ctx._get_file_size.return_value = 1000
         ctx.get_file_progress.return_value = [500]  # 50%
-        ctx.handle.file_priority.return_value = 1
+        ctx.get_file_priority.return_value = 1
 
         result = _collect_ready_files(ctx)
         assert result == []
         ctx.get_file_progress.assert_called_once_with(verified_only=True)
-        ctx.handle.file_priority.assert_called_once_with(0)
-        ctx.handle.file_priorities.assert_not_called()
+        ctx.get_file_priority.assert_called_once_with(0)
+        ctx.set_file_priority.assert_not_called()
 
     def test_belatedly_prioritizes_file_with_new_getter(self):
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
         ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         mock_files = MagicMock()
-        mock_files.file_size.return_value = 1000
 
         mock_ti = MagicMock()
         mock_ti.files.return_value = mock_files
         ctx.torrent_info_obj = mock_ti
 
         ctx._find_file_index.return_value = 0
+        ctx._get_file_size.return_value = 1000
         ctx.get_file_progress.return_value = [1000]
         ctx._get_lt_disk_path.return_value = "/tmp/p2p/model.bin"
-
-        def file_priority_side_effect(*args):
-            if args == (0,):
-                return 0
-            return None
-
-        ctx.handle.file_priority.side_effect = file_priority_side_effect
+        ctx.get_file_priority.return_value = 0
 
         result = _collect_ready_files(ctx)
 
         assert result == [("/tmp/p2p/model.bin", "/dest/model.bin", "model.bin")]
-        assert ctx.handle.file_priority.call_args_list[0].args == (0,)
-        assert ctx.handle.file_priority.call_args_list[1].args == (0, 1)
-        ctx.handle.file_priorities.assert_not_called()
+        ctx.get_file_priority.assert_called_once_with(0)
+        ctx.set_file_priority.assert_called_once_with(0, 1)
 
 
 # ─── Integration: deliver outside lock ───────────────────────────────────────
@@ -541,8 +531,6 @@ class TestDeliverOutsideLock:
         This prevents large file copies from blocking download_file() callers."""
         ctx = make_mock_ctx()
 
-        event = threading.Event()
-        ctx.file_events = {"model.bin": event}
         ctx.file_destinations = {"model.bin": "/dest/model.bin"}
 
         # No error
@@ -551,12 +539,12 @@ class TestDeliverOutsideLock:
         ctx.handle.status.return_value = status
 
         mock_files = MagicMock()
-        mock_files.file_size.return_value = 1000
         mock_ti = MagicMock()
         mock_ti.files.return_value = mock_files
         ctx.torrent_info_obj = mock_ti
 
         ctx._find_file_index.return_value = 0
+        ctx._get_file_size.return_value = 1000
         ctx.get_file_progress.return_value = [1000]
         ctx.handle.file_priorities.return_value = [1]
         ctx._get_lt_disk_path.return_value = "/tmp/p2p/model.bin"
@@ -585,5 +573,5 @@ class TestDeliverOutsideLock:
             "_deliver_file should have been called exactly once"
         assert lock_was_held_during_deliver[0] is False, \
             "_deliver_file was called while ctx.lock was held! This blocks download_file() callers."
-        assert event.is_set()
+        ctx._mark_file_completed.assert_called_once_with("model.bin")
         ctx.get_file_progress.assert_called_once_with(verified_only=True)
@@ -17,6 +17,7 @@ from huggingface_hub import file_download
 
 import llmpt
 from llmpt.patch import apply_patch, remove_patch
+from llmpt.patch_context import apply_download_context
 from llmpt.utils import get_hf_hub_cache
 
 
@@ -82,12 +83,15 @@ def test_p2p_interception_flow():
 
     with patch('llmpt.transfer_coordinator.TransferCoordinator', return_value=mock_coordinator):
 
-        # Manually set ThreadLocal context (normally done by patched_hf_hub_download)
-        patch_module._context.repo_id = "demo/repo"
-        patch_module._context.filename = "model.bin"
-        patch_module._context.revision = "main"
-        patch_module._context.tracker = mock_tracker_client
-        patch_module._context.config = config
+        # Manually set the download context (normally done by patched_hf_hub_download)
+        apply_download_context(
+            patch_module._context,
+            repo_id="demo/repo",
+            filename="model.bin",
+            revision="main",
+            tracker=mock_tracker_client,
+            config=config,
+        )
 
         try:
             # Trigger the patched http_get via the real module reference
@@ -111,11 +115,7 @@ def test_p2p_interception_flow():
             )
         finally:
             # Cleanup context
-            patch_module._context.repo_id = None
-            patch_module._context.filename = None
-            patch_module._context.revision = None
-            patch_module._context.tracker = None
-            patch_module._context.config = None
+            patch_module._context.set(None)
 
 
 def test_snapshot_download_notification_handles_storage_key_shape():
@@ -168,3 +168,26 @@ def test_deferred_key_normalizes_default_hub_cache():
         revision="main",
         repo_type="model",
     ) == ("model", "demo/repo", "main", "hub_cache", get_hf_hub_cache())
+
+
+def test_torrent_prefetch_dedupes_in_flight_lookups():
+    """One background lookup per (repo, revision); branch names are skipped."""
+    import llmpt.patch as patch_module
+
+    tracker = MagicMock()
+    tracker.tracker_url = "http://test"
+    revision = "a" * 40
+
+    try:
+        first = patch_module._submit_torrent_prefetch(tracker, "demo/repo", revision, "model")
+        second = patch_module._submit_torrent_prefetch(tracker, "demo/repo", revision, "model")
+        assert first is second
+        first.result(timeout=5)
+        tracker.get_torrent_info.assert_called_once_with(
+            "demo/repo", revision, repo_type="model"
+        )
+
+        # Non-commit-hash revisions are not cacheable, so nothing is prefetched.
+        assert patch_module._submit_torrent_prefetch(tracker, "demo/repo", "main", "model") is None
+    finally:
+        patch_module._shutdown_prefetch_executor()
@@ -1,25 +1,28 @@
 """Tests for patch-layer context helpers."""
 
-import threading
+from contextvars import ContextVar
 
 
-def test_read_thread_local_context_requires_core_fields():
-    from llmpt.patch_context import read_thread_local_context
+def _make_context_var():
+    return ContextVar("test_p2p_context", default=None)
 
-    context = threading.local()
-    context.repo_id = "demo/repo"
-    context.filename = "model.bin"
 
-    assert read_thread_local_context(context) is None
+def test_read_download_context_requires_core_fields():
+    from llmpt.patch_context import read_download_context
 
+    context = _make_context_var()
+    context.set({"repo_id": "demo/repo", "filename": "model.bin"})
 
-def test_apply_and_read_thread_local_context_round_trip():
-    from llmpt.patch_context import apply_thread_local_context, read_thread_local_context
+    assert read_download_context(context) is None
 
-    context = threading.local()
+
+def test_apply_and_read_download_context_round_trip():
+    from llmpt.patch_context import apply_download_context, read_download_context
+
+    context = _make_context_var()
     config = {"timeout": 60}
 
-    apply_thread_local_context(
+    apply_download_context(
         context,
         repo_id="demo/repo",
         repo_type="model",
@@ -30,7 +33,7 @@ def test_apply_and_read_thread_local_context_round_trip():
         cache_dir="/tmp/cache",
     )
 
-    result = read_thread_local_context(context)
+    result = read_download_context(context)
 
     assert result is not None
     assert result["repo_id"] == "demo/repo"
@@ -42,24 +45,24 @@ def test_apply_and_read_thread_local_context_round_trip():
     assert result["cache_dir"] == "/tmp/cache"
 
 
-def test_capture_and_restore_thread_local_context():
+def test_capture_and_restore_download_context():
     from llmpt.patch_context import (
-        apply_thread_local_context,
-        capture_thread_local_context,
-        restore_thread_local_context,
+        apply_download_context,
+        capture_download_context,
+        restore_download_context,
     )
 
-    context = threading.local()
-    apply_thread_local_context(
+    context = _make_context_var()
+    apply_download_context(
         context,
         repo_id="first/repo",
         repo_type="model",
         filename="first.bin",
         revision="main",
     )
-    snapshot = capture_thread_local_context(context)
+    snapshot = capture_download_context(context)
 
-    apply_thread_local_context(
+    apply_download_context(
         context,
         repo_id="second/repo",
         repo_type="dataset",
@@ -67,10 +70,11 @@ def test_capture_and_restore_thread_local_context():
         revision="dev",
         local_dir="/tmp/local",
     )
-    restore_thread_local_context(context, snapshot)
-
-    assert context.repo_id == "first/repo"
-    assert context.repo_type == "model"
-    assert context.filename == "first.bin"
-    assert context.revision == "main"
-    assert context.local_dir is None
+    restore_download_context(context, snapshot)
+
+    restored = context.get()
+    assert restored["repo_id"] == "first/repo"
+    assert restored["repo_type"] == "model"
+    assert restored["filename"] == "first.bin"
+    assert restored["revision"] == "main"
+    assert restored["local_dir"] is None
@@ -32,6 +32,13 @@ def cleanup():
     remove_patch()
 
 
+@pytest.fixture(autouse=True)
+def fast_debounce(monkeypatch):
+    """Shrink the deferred-notification quiet period so tests don't sleep 2s+."""
+    from llmpt import patch_runtime
+    monkeypatch.setattr(patch_runtime, '_DEFERRED_DEBOUNCE_SECONDS', 0.05)
+
+
 def test_snapshot_download_module_is_patched_after_apply():
     """
     Even though we imported _snapshot_download before apply_patch(),
@@ -155,8 +162,8 @@ class TestDeferredDaemonNotification:
                     patch_mod._patched_hf_hub_download('test/repo', 'model.bin',
                                                        revision='main')
 
-                    # The timer is 2 seconds — wait a bit longer
-                    time.sleep(2.5)
+                    # Wait past the (shrunken) debounce window
+                    time.sleep(0.5)
 
                     # Deferred notification should have fired
                     mock_notify.assert_called_once()
@@ -187,7 +194,7 @@ class TestDeferredDaemonNotification:
                     patch_mod._patched_hf_hub_download('test/repo', 'model.bin',
                                                        revision='main')
 
-                    time.sleep(2.5)
+                    time.sleep(0.5)
 
                     # No deferred notification should have fired
                     mock_notify.assert_not_called()
@@ -213,7 +220,7 @@ class TestDeferredDaemonNotification:
                     patch_mod._patched_hf_hub_download('test/repo', 'model.bin', revision='rev-a')
                     patch_mod._patched_hf_hub_download('test/repo', 'model.bin', revision='rev-b')
 
-                    time.sleep(2.5)
+                    time.sleep(0.5)
 
                     assert mock_notify.call_count == 2
                     notified_revs = sorted(call.kwargs['revision'] for call in mock_notify.call_args_list)
@@ -238,7 +245,7 @@ class TestDeferredDaemonNotification:
                     with pytest.raises(RuntimeError, match="download failed"):
                         patch_mod._patched_hf_hub_download('test/repo', 'model.bin', revision='main')
 
-                    time.sleep(2.5)
+                    time.sleep(0.5)
                     mock_notify.assert_not_called()
 
     def test_hf_hub_download_deferred_marks_completed_snapshot_for_local_dir(self):
@@ -271,7 +278,7 @@ class TestDeferredDaemonNotification:
                     )
 
                 snapshot_download()
-                time.sleep(2.5)
+                time.sleep(0.5)
 
                 mock_notify.assert_called_once()
                 call_args = mock_notify.call_args
@@ -310,7 +317,7 @@ class TestDeferredDaemonNotification:
                     )
 
                 snapshot_download()
-                time.sleep(2.5)
+                time.sleep(0.5)
 
                 mock_notify.assert_called_once()
                 call_args = mock_notify.call_args
@@ -667,8 +674,8 @@ class TestStackFrameInspection:
 
                 hf_hub_download()
 
-                # Wait for the deferred timer (2 seconds) to fire
-                time.sleep(2.5)
+                # Wait past the (shrunken) debounce window
+                time.sleep(0.5)
 
                 mock_notify.assert_called_once()
                 call_args = mock_notify.call_args
@@ -719,7 +726,7 @@ class TestStackFrameInspection:
                     _call_http_get()
 
                 hf_hub_download()
-                time.sleep(2.5)
+                time.sleep(0.5)
                 mock_notify.assert_not_called()
 
     def test_http_get_deferred_notification_marks_completed_snapshot_for_local_dir(self):
@@ -761,7 +768,7 @@ class TestStackFrameInspection:
                     _hf_hub_download_to_local_dir()
 
                 snapshot_download()
-                time.sleep(2.5)
+                time.sleep(0.5)
 
                 mock_notify.assert_called_once()
                 call_args = mock_notify.call_args
@@ -810,7 +817,7 @@ class TestStackFrameInspection:
                     _hf_hub_download_to_cache_dir()
 
                 snapshot_download()
-                time.sleep(2.5)
+                time.sleep(0.5)
 
                 mock_notify.assert_called_once()
                 call_args = mock_notify.call_args
@@ -26,6 +26,7 @@ from llmpt.patch import (
     _patched_hf_hub_download,
     _patched_snapshot_download,
 )
+from llmpt.patch_context import apply_download_context
 from llmpt.transfer_types import TransferResult
 
 
@@ -45,10 +46,8 @@ def clean_patch_state():
     patch_module._original_snapshot_hf_tqdm = None
     patch_module._config = {}
     reset_download_stats()
-    # Clear thread-local context
-    for attr in ('repo_id', 'repo_type', 'filename', 'revision', 'tracker', 'config', 'cache_dir', 'local_dir'):
-        if hasattr(patch_module._context, attr):
-            delattr(patch_module._context, attr)
+    # Clear download context
+    patch_module._context.set(None)
     yield
     remove_patch()
     for timer in patch_module._deferred_timers.values():
@@ -155,11 +154,14 @@ class TestPatchedHttpGetP2PSuccess:
             via="p2p",
         )
 
-        patch_module._context.repo_id = "test/repo"
-        patch_module._context.filename = "model.bin"
-        patch_module._context.revision = "main"
-        patch_module._context.tracker = MagicMock()
-        patch_module._context.config = {'timeout': 60}
+        apply_download_context(
+            patch_module._context,
+            repo_id="test/repo",
+            filename="model.bin",
+            revision="main",
+            tracker=MagicMock(),
+            config={'timeout': 60},
+        )
 
         temp_file = MagicMock()
         temp_file.name = "/tmp/fake"
@@ -191,11 +193,14 @@ class TestPatchedHttpGetP2PFailure:
             via="fallback",
         )
 
-        patch_module._context.repo_id = "test/repo"
-        patch_module._context.filename = "model.bin"
-        patch_module._context.revision = "main"
-        patch_module._context.tracker = MagicMock()
-        patch_module._context.config = {'timeout': 60}
+        apply_download_context(
+            patch_module._context,
+            repo_id="test/repo",
+            filename="model.bin",
+            revision="main",
+            tracker=MagicMock(),
+            config={'timeout': 60},
+        )
 
         temp_file = MagicMock()
         temp_file.name = "/tmp/fake"
@@ -219,11 +224,14 @@ class TestPatchedHttpGetP2PFailure:
         mock_original = MagicMock()
         patch_module._original_http_get = mock_original
 
-        patch_module._context.repo_id = "test/repo"
-        patch_module._context.filename = "model.bin"
-        patch_module._context.revision = "main"
-        patch_module._context.tracker = MagicMock()
-        patch_module._context.config = {}
+        apply_download_context(
+            patch_module._context,
+            repo_id="test/repo",
+            filename="model.bin",
+            revision="main",
+            tracker=MagicMock(),
+            config={},
+        )
 
         temp_file = MagicMock()
         temp_file.name = "/tmp/fake"
@@ -279,7 +287,7 @@ class TestPatchedHfHubDownload:
         mock_original.assert_called_once_with("test/repo", "model.bin", revision="v1")
 
         # Context should be restored (cleared since there was no previous context)
-        assert getattr(patch_module._context, 'repo_id', None) is None
+        assert (patch_module._context.get() or {}).get('repo_id') is None
 
     def test_subfolder_handling(self):
         """Subfolder should be prepended to filename in context."""
@@ -290,7 +298,7 @@ class TestPatchedHfHubDownload:
         contexts_seen = []
 
         def capture_context(*args, **kwargs):
-            contexts_seen.append(getattr(patch_module._context, 'filename', None))
+            contexts_seen.append((patch_module._context.get() or {}).get('filename'))
             return "/path/to/file"
 
         mock_original.side_effect = capture_context
@@ -310,7 +318,7 @@ class TestPatchedHfHubDownload:
         contexts_seen = []
 
         def capture_context(*args, **kwargs):
-            contexts_seen.append(getattr(patch_module._context, 'filename', None))
+            contexts_seen.append((patch_module._context.get() or {}).get('filename'))
             return "/path/to/file"
 
         mock_original.side_effect = capture_context
@@ -327,8 +335,11 @@ class TestPatchedHfHubDownload:
         patch_module._config = {'tracker_url': 'http://tracker.example.com'}
 
         # Set some pre-existing context
-        patch_module._context.repo_id = "prev/repo"
-        patch_module._context.filename = "prev.bin"
+        apply_download_context(
+            patch_module._context,
+            repo_id="prev/repo",
+            filename="prev.bin",
+        )
 
         with patch('llmpt.tracker_client.TrackerClient'), \
              patch('llmpt.utils.resolve_commit_hash', side_effect=lambda r, rev, **kw: rev):
@@ -336,8 +347,9 @@ class TestPatchedHfHubDownload:
                 _patched_hf_hub_download("test/repo", "model.bin", revision="main")
 
         # Context should be restored to previous values
-        assert patch_module._context.repo_id == "prev/repo"
-        assert patch_module._context.filename == "prev.bin"
+        restored = patch_module._context.get()
+        assert restored["repo_id"] == "prev/repo"
+        assert restored["filename"] == "prev.bin"
 
     def test_failed_single_file_preserves_resumable_state(self):
         patch_module._original_hf_hub_download = MagicMock(side_effect=RuntimeError("fail"))
@@ -744,3 +756,71 @@ class TestDeferredNotification:
             local_dir=None,
             completed=True,
         )
+
+
+# ─── _patched_http_get: small-file fast path ─────────────────────────────────
+
+class TestPatchedHttpGetSmallFileSkip:
+
+    def test_small_expected_size_skips_p2p_entirely(self):
+        """Tiny blobs should go straight to HTTP without touching the coordinator."""
+        mock_original = MagicMock()
+        patch_module._original_http_get = mock_original
+
+        apply_download_context(
+            patch_module._context,
+            repo_id="test/repo",
+            filename="config.json",
+            revision="main",
+            tracker=MagicMock(),
+            config={'timeout': 60},
+        )
+
+        temp_file = MagicMock()
+        temp_file.name = "/tmp/fake"
+
+        with patch('llmpt.transfer_coordinator.TransferCoordinator') as coordinator_cls:
+            _patched_http_get(
+                "http://example.com/config.json",
+                temp_file=temp_file,
+                expected_size=512,
+            )
+
+        coordinator_cls.assert_not_called()
+        mock_original.assert_called_once()
+        stats = get_download_stats()
+        assert "config.json" in stats['http']
+
+    def test_large_expected_size_still_attempts_p2p(self):
+        """Blobs at or above the threshold keep the normal P2P intercept."""
+        mock_original = MagicMock()
+        patch_module._original_http_get = mock_original
+
+        mock_coordinator = MagicMock()
+        mock_coordinator.fulfill_request.return_value = TransferResult(
+            success=True,
+            delivered_path="/tmp/fake",
+            via="p2p",
+        )
+
+        apply_download_context(
+            patch_module._context,
+            repo_id="test/repo",
+            filename="model.bin",
+            revision="main",
+            tracker=MagicMock(),
+            config={'timeout': 60},
+        )
+
+        temp_file = MagicMock()
+        temp_file.name = "/tmp/fake"
+
+        with patch('llmpt.transfer_coordinator.TransferCoordinator', return_value=mock_coordinator):
+            _patched_http_get(
+                "http://example.com/model.bin",
+                temp_file=temp_file,
+                expected_size=50 * 1024 * 1024,
+            )
+
+        mock_coordinator.fulfill_request.assert_called_once()
+        mock_original.assert_not_called()
@@ -6,7 +6,9 @@ Covers: _init_torrent, download_file, _find_file_index, _deliver_file,
 All libtorrent interactions are mocked.
 """
 
+import array
 import os
+import shutil
 import threading
 import pytest
 from unittest.mock import patch, MagicMock, call, mock_open
@@ -166,6 +168,40 @@ class TestGetFileProgress:
         ctx.handle.file_progress.assert_called_once_with(piece_flag)
 
 
+# ─── file priority cache ──────────────────────────────────────────────────────
+
+class TestFilePriorityCache:
+
+    def test_set_skips_unchanged_priority(self, make_ctx):
+        ctx = make_ctx()
+        ctx.handle = MagicMock()
+        ctx._file_priorities = array.array('B', [0, 1])
+
+        ctx.set_file_priority(1, 1)  # unchanged → no libtorrent call
+        ctx.handle.file_priority.assert_not_called()
+
+        ctx.set_file_priority(0, 1)  # changed → one call, cache updated
+        ctx.handle.file_priority.assert_called_once_with(0, 1)
+        assert list(ctx._file_priorities) == [1, 1]
+
+    def test_get_served_from_cache(self, make_ctx):
+        ctx = make_ctx()
+        ctx.handle = MagicMock()
+        ctx._file_priorities = array.array('B', [0, 1])
+
+        assert ctx.get_file_priority(1) == 1
+        ctx.handle.file_priority.assert_not_called()
+
+    def test_get_falls_back_without_cache(self, make_ctx):
+        """full_seed sessions keep no cache; reads go to libtorrent."""
+        ctx = make_ctx()
+        ctx.handle = MagicMock()
+        ctx.handle.file_priority.return_value = 4
+
+        assert ctx.get_file_priority(0) == 4
+        ctx.handle.file_priority.assert_called_once_with(0)
+
+
 # ─── _find_file_index ─────────────────────────────────────────────────────────
 
 class TestFindFileIndex:
@@ -211,6 +247,24 @@ class TestFindFileIndex:
 
         assert ctx._find_file_index("model.bin") is None
 
+    def test_file_list_is_scanned_only_once(self, make_ctx):
+        """Repeated lookups must reuse the cached index map, not rescan."""
+        ctx = make_ctx()
+        mock_files = MagicMock()
+        mock_files.num_files.return_value = 2
+        mock_files.file_path.side_effect = lambda i: [
+            "root/config.json",
+            "root/model.bin",
+        ][i]
+        ctx.torrent_info_obj = MagicMock()
+        ctx.torrent_info_obj.files.return_value = mock_files
+
+        assert ctx._find_file_index("model.bin") == 1
+        assert ctx._find_file_index("config.json") == 0
+        assert ctx._find_file_index("missing.bin") is None
+        # One file_path call per file, regardless of lookup count
+        assert mock_files.file_path.call_count == 2
+
     def test_backslash_normalization(self, make_ctx):
         """Windows-style backslashes should be normalized."""
         ctx = make_ctx()
@@ -263,11 +317,31 @@ class TestDeliverFile:
         assert dst.read_bytes() == b"hello"
         # src MUST NOT be deleted so Libtorrent can continue reading chunks
         assert src.exists()
-        mock_link.assert_called_once_with(str(src), str(dst))
+        # Link targets a temp sibling which os.replace() then moves to dst
+        mock_link.assert_called_once()
+        link_src, link_tmp = mock_link.call_args[0]
+        assert link_src == str(src)
+        assert link_tmp.startswith(str(dst))
+        assert link_tmp != str(dst)
         mock_copy.assert_not_called()
 
     def test_cross_device_fallback(self, make_ctx, tmp_path):
-        """When os.link fails with OSError, should fall back to shutil.copy2."""
+        """When os.link fails with OSError, should fall back to a kernel copy."""
+        ctx = make_ctx()
+
+        src = tmp_path / "src.bin"
+        src.write_bytes(b"data")
+        dst = tmp_path / "dst.bin"
+
+        with patch('os.link', side_effect=OSError("cross-device")):
+            ctx._deliver_file(str(src), str(dst))
+
+        assert dst.read_bytes() == b"data"
+        # src MUST NOT be deleted so libtorrent can continue reading chunks
+        assert src.exists()
+
+    def test_cross_device_fallback_without_kernel_copy(self, make_ctx, tmp_path):
+        """When every kernel copy mechanism fails, degrade to shutil.copy2."""
         ctx = make_ctx()
 
         src = tmp_path / "src.bin"
@@ -275,9 +349,15 @@ class TestDeliverFile:
         dst = tmp_path / "dst.bin"
 
         with patch('os.link', side_effect=OSError("cross-device")), \
-             patch('shutil.copy2') as mock_copy:
+             patch('fcntl.ioctl', side_effect=OSError("not supported")), \
+             patch('os.copy_file_range', side_effect=OSError("not supported")), \
+             patch('os.sendfile', side_effect=OSError("not supported")), \
+             patch('shutil.copy2', side_effect=shutil.copy2) as mock_copy:
             ctx._deliver_file(str(src), str(dst))
-            mock_copy.assert_called_once_with(str(src), str(dst))
+            mock_copy.assert_called_once()
+            assert mock_copy.call_args[0][0] == str(src)
+
+        assert dst.read_bytes() == b"data"
 
     def test_overwrites_existing_destination(self, make_ctx, tmp_path):
         """If dst already exists, it should be removed before linking."""
@@ -573,7 +653,7 @@ class TestDownloadFile:
         assert result is False
 
     def test_timeout_returns_false(self, make_ctx, mock_lt):
-        """If event is never set within timeout, should return False."""
+        """If completion is never signalled within timeout, should return False."""
         ctx = make_ctx(timeout=1)  # 1 second timeout
         ctx.handle = MagicMock()
         ctx.is_valid = True
@@ -589,7 +669,8 @@ class TestDownloadFile:
         ctx.handle.status.return_value.state = 3  # downloading
         ctx.handle.file_progress.return_value = [0]
 
-        with patch.object(ctx, '_init_torrent', return_value=True):
+        with patch.object(ctx, '_init_torrent', return_value=True), \
+             patch.dict(os.environ, {'HF_P2P_SMALL_FILE_THRESHOLD': '0'}):
             result = ctx.download_file("model.bin", "/dest/model.bin")
 
         assert result is False
@@ -622,12 +703,38 @@ class TestDownloadFile:
 
         dst = tmp_path / "dest" / "model.bin"
 
-        with patch.object(ctx, '_init_torrent', return_value=True):
+        with patch.object(ctx, '_init_torrent', return_value=True), \
+             patch.dict(os.environ, {'HF_P2P_SMALL_FILE_THRESHOLD': '0'}):
             result = ctx.download_file("model.bin", str(dst))
 
         assert result is True
         assert dst.exists()
 
+    def test_small_file_skips_p2p_for_http(self, make_ctx, mock_lt):
+        """Files under the threshold should decline P2P while still downloading."""
+        ctx = make_ctx(timeout=5)
+        ctx.handle = MagicMock()
+        ctx.is_valid = True
+
+        mock_files = MagicMock()
+        mock_files.num_files.return_value = 1
+        mock_files.file_path.return_value = "root/config.json"
+        mock_files.file_size.return_value = 512  # well under 1 MiB
+
+        mock_ti = MagicMock()
+        mock_ti.files.return_value = mock_files
+        ctx.torrent_info_obj = mock_ti
+
+        ctx.handle.status.return_value.state = 3  # downloading
+
+        with patch.object(ctx, '_init_torrent', return_value=True):
+            result = ctx.download_file("config.json", "/dest/config.json")
+
+        assert result is False
+        # Not registered, not prioritized — nothing for the monitor to track.
+        assert "config.json" not in ctx.file_destinations
+        ctx.handle.file_priority.assert_not_called()
+
     def test_immediate_delivery_when_torrent_finished(self, make_ctx, mock_lt, tmp_path):
         """If torrent is already finished, file should be delivered immediately."""
         ctx = make_ctx(timeout=5)
@@ -827,7 +934,7 @@ class TestMapAllFilesForSeeding:
         assert ctx.full_mapping is False
 
     def test_cross_filesystem_fallback(self, make_ctx, mock_lt):
-        """When hardlink fails (OSError), should fall back to legacy rename_file + force_recheck."""
+        """When hardlink fails (OSError), should fall back to legacy rename_file + seed_mode."""
         ctx = make_ctx()
         ctx.handle = MagicMock()
         ctx.temp_dir = "/tmp/p2p_root"
@@ -857,11 +964,11 @@ class TestMapAllFilesForSeeding:
             result = ctx.map_all_files_for_seeding()
 
         assert result is True
-        # Should have fallen back to legacy: rename_file + force_recheck
+        # Should have fallen back to legacy: rename_file + background
+        # force_recheck (seed_mode cannot be set on a running torrent, so
+        # the renamed files must be verified before they can be served)
         ctx.handle.rename_file.assert_called()
         ctx.handle.force_recheck.assert_called_once()
-        # seed_mode should NOT have been set
-        ctx.handle.set_flags.assert_not_called()
         assert ctx.seeding_mapped_files == 1
         assert ctx.seeding_total_files == 1
         assert ctx.full_mapping is True
@@ -246,7 +246,10 @@ class TestCreateTorrent:
         mock_fs.add_file.assert_any_call("local_dir/config.json", 16)
         mock_fs.add_file.assert_any_call("local_dir/model.bin", 1000)
         assert mock_fs.add_file.call_count == 2
-        mock_lt.set_piece_hashes.assert_called_once_with(mock_torrent_obj, str(local_dir.parent))
+        mock_lt.set_piece_hashes.assert_called_once()
+        hash_args = mock_lt.set_piece_hashes.call_args[0]
+        assert hash_args[0] is mock_torrent_obj
+        assert hash_args[1] == str(local_dir.parent)
         mock_lt.create_torrent.assert_called_once_with(
             mock_fs,
             result["piece_length"],
@@ -226,6 +226,87 @@ def test_resolve_file_sources_missing_endpoint_returns_empty(tracker_client):
     assert result == []
 
 
+@responses.activate
+def test_prefetch_file_sources_seeds_per_file_cache(tracker_client):
+    """A batched lookup answers later per-file queries without extra HTTP calls."""
+    from llmpt.tracker_client import clear_torrent_info_cache
+    clear_torrent_info_cache()
+
+    responses.add(
+        responses.POST,
+        "http://tracker.example.com/api/v1/file-sources/batch",
+        json={
+            "data": {
+                "files": {
+                    "model.bin": [
+                        {
+                            "repo_id": "demo/repo",
+                            "revision": "oldrev",
+                            "repo_type": "model",
+                            "path": "model.bin",
+                            "file_root": "abc123",
+                            "size": 100,
+                            "seeders": 4,
+                        },
+                    ],
+                    "config.json": [],
+                }
+            }
+        },
+        status=200,
+    )
+
+    assert tracker_client.prefetch_file_sources(
+        "demo/repo",
+        "main",
+        ["model.bin", "config.json"],
+    ) is True
+
+    import json
+    request_body = json.loads(responses.calls[0].request.body)
+    assert request_body["repo_id"] == "demo/repo"
+    assert request_body["paths"] == ["model.bin", "config.json"]
+
+    # Both per-file lookups are answered from the cache — no GET requests.
+    result = tracker_client.resolve_file_sources("demo/repo", "main", "model.bin")
+    assert len(result) == 1
+    assert result[0].revision == "oldrev"
+    assert result[0].seeders == 4
+    assert tracker_client.resolve_file_sources("demo/repo", "main", "config.json") == []
+    assert len(responses.calls) == 1
+
+    clear_torrent_info_cache()
+
+
+@responses.activate
+def test_prefetch_file_sources_missing_endpoint_returns_false(tracker_client):
+    """Old trackers without the batch endpoint leave per-file lookups in place."""
+    from llmpt.tracker_client import clear_torrent_info_cache
+    clear_torrent_info_cache()
+
+    responses.add(
+        responses.POST,
+        "http://tracker.example.com/api/v1/file-sources/batch",
+        status=404,
+    )
+
+    assert tracker_client.prefetch_file_sources(
+        "demo/repo",
+        "main",
+        ["model.bin"],
+    ) is False
+
+    responses.add(
+        responses.GET,
+        "http://tracker.example.com/api/v1/file-sources",
+        status=404,
+    )
+
+    # The per-file path still goes to the tracker (nothing was cached).
+    assert tracker_client.resolve_file_sources("demo/repo", "main", "model.bin") == []
+    assert len(responses.calls) == 2
+
+
 @responses.activate
 def test_register_torrent_success(tracker_client):
     """Test successful torrent registration."""